@@ -5,6 +5,9 @@ import pygame
 from uinex import Button
 from uinex import Label
 from uinex import Separator
+from uinex import WidgetManager
+
+WINDOW_FILL = (255, 255, 255)
 
 # --------------------------------------------------------------------
 # Simple Widget Demonstration.
@@ -19,6 +22,8 @@ if __name__ == "__main__":
 
     BACKGROUND = (0, 233, 45)
     ACCENT = (58, 141, 255)
+    FPS = 60
+    IDLE_TIMEOUT_MS = 250
 
     label = Label(master=screen, text="My Label", width=500, background=BACKGROUND)
     label.place(x=30, y=10)
@@ -33,25 +38,37 @@ if __name__ == "__main__":
     # Main loop
     # -------------------------------------------------------------------------
 
+    manager = WidgetManager()
+    manager.register(separator)
+    manager.register(button)
+    manager.register(label)
+
+    clock = pygame.time.Clock()
+    full_redraw: bool = True
     running: bool = True
     while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
+        dt = clock.tick(FPS) / 1000
 
-            separator.handle(event)
-            button.handle(event)
-            label.handle(event)
+        if manager.has_animations():
+            events = pygame.event.get()
+        else:
+            # Nothing animates: sleep until input arrives instead of spinning
+            events = [pygame.event.wait(IDLE_TIMEOUT_MS), *pygame.event.get()]
 
-        separator.update()
-        button.update()
-        label.update()
+        for event in manager.process_events(events, dt=dt):
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.VIDEOEXPOSE:
+                full_redraw = True
 
-        screen.fill(pygame.Color("#ffffff"))
+        screen.fill(WINDOW_FILL)
 
-        separator.draw()
-        button.draw()
-        label.draw()
+        dirty_rects = manager.draw_all(screen)
 
-        pygame.display.flip()
+        # Present the whole window once (and after exposes), then only what changed
+        if full_redraw:
+            pygame.display.flip()
+            full_redraw = False
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
     pygame.quit()
@@ -144,6 +144,60 @@ class TestWidgetManager:
         unconsumed = mgr.process_events(events, dt=0.0)
         assert len(unconsumed) == 0, "Dialog should consume all events while open"
 
+    def test_process_events_routes_custom_events_by_default(self, screen):
+        from uinex import Button
+        from uinex.widget.manager import WidgetManager
+
+        received = []
+
+        class Custom(Button):
+            def _handle_event_(self, event, *args, **kwargs):
+                received.append(event.type)
+
+        mgr = WidgetManager()
+        mgr.register(Custom(master=screen, text="A"))
+        event = pygame.event.Event(pygame.USEREVENT)
+        assert mgr.process_events([event]) == [event]
+        assert received == [pygame.USEREVENT]
+        assert mgr.subscribed_events() is None
+
+    def test_process_events_routes_bound_types_after_register(self, screen):
+        from uinex import Button
+        from uinex.widget.manager import WidgetManager
+
+        class Narrow(Button):
+            _handled_events = frozenset({pygame.MOUSEBUTTONDOWN})
+
+        mgr = WidgetManager()
+        btn = Narrow(master=screen, text="A")
+        mgr.register(btn)
+        event = pygame.event.Event(pygame.USEREVENT)
+        assert mgr.process_events([event]) == [event]
+        assert pygame.USEREVENT not in mgr.subscribed_events()
+
+        results = []
+        btn.bind(pygame.USEREVENT, lambda: results.append(True))
+        assert mgr.process_events([event]) == []
+        assert results == [True]
+        assert pygame.USEREVENT in mgr.subscribed_events()
+
+    def test_frame_plan_follows_registration_changes(self, screen):
+        from uinex import Frame
+        from uinex.widget.manager import WidgetManager
+
+        mgr = WidgetManager()
+        first = Frame(master=screen, width=10, height=10)
+        second = Frame(master=screen, width=10, height=10)
+        mgr.register(first)
+        assert mgr._draw_plan_() == (first,)
+
+        mgr.register(second, layer=WidgetManager.OVERLAY_LAYER)
+        assert mgr._draw_plan_() == (first, second)
+        assert len(mgr._update_plan_()) == 2
+
+        mgr.unregister(first)
+        assert mgr._draw_plan_() == (second,)
+
     def test_draw_all_does_not_raise(self, screen):
         from uinex import Button
         from uinex import Label
@@ -159,6 +213,132 @@ class TestWidgetManager:
         screen.fill((20, 20, 30))
         mgr.draw_all(screen)  # Should not raise
 
+    def test_draw_all_batches_composited_widgets_in_order(self, screen):
+        from uinex import Frame
+        from uinex import Label
+        from uinex.widget.manager import WidgetManager
+
+        mgr = WidgetManager()
+        under = Frame(master=screen, width=100, height=100)
+        under.set_background((255, 0, 0))
+        under.place(x=0, y=0)
+        middle = Label(master=screen, text="", width=50, height=50, background=(0, 255, 0))
+        middle.place(x=0, y=0)
+        over = Frame(master=screen, width=20, height=20)
+        over.set_background((0, 0, 255))
+        over.place(x=0, y=0)
+        for widget in (under, middle, over):
+            mgr.register(widget)
+
+        screen.fill((0, 0, 0))
+        mgr.draw_all(screen)
+
+        assert screen.get_at((5, 5))[:3] == (0, 0, 255)
+        assert screen.get_at((30, 30))[:3] == (0, 255, 0)
+        assert screen.get_at((80, 80))[:3] == (255, 0, 0)
+
+    def test_draw_all_splits_batches_on_blend_mode(self, screen):
+        from uinex import Frame
+        from uinex.widget.manager import WidgetManager
+
+        mgr = WidgetManager()
+        under = Frame(master=screen, width=20, height=20)
+        under.set_background((100, 0, 0))
+        under.place(x=0, y=0)
+        over = Frame(master=screen, width=20, height=20)
+        over.set_background((0, 0, 100))
+        over.place(x=0, y=0)
+        over.blendmode = pygame.BLEND_RGB_ADD
+        mgr.register(under)
+        mgr.register(over)
+
+        screen.fill((0, 0, 0))
+        mgr.draw_all(screen)
+
+        assert screen.get_at((5, 5))[:3] == (100, 0, 100)
+
+    def test_draw_all_fills_solid_widgets_in_order(self, screen, monkeypatch):
+        from uinex import Frame
+        from uinex.widget.manager import WidgetManager
+        from uinex.widget.separator import Separator
+
+        mgr = WidgetManager()
+        under = Frame(master=screen, width=40, height=40)
+        under.set_background((255, 0, 0))
+        under.place(x=0, y=0)
+        line = Separator(master=screen, length=40, thickness=4, color=(0, 255, 0))
+        line.place(x=0, y=10)
+        mgr.register(under)
+        mgr.register(line)
+
+        monkeypatch.setattr(Separator, "_recompose_", lambda self: pytest.fail("solid widget recomposed"))
+        screen.fill((0, 0, 0))
+        mgr.draw_all(screen)
+
+        assert screen.get_at((5, 12))[:3] == (0, 255, 0)
+        assert screen.get_at((5, 30))[:3] == (255, 0, 0)
+
+    @pytest.mark.parametrize("alpha", [0, 128])
+    def test_draw_all_blends_translucent_separators(self, screen, alpha):
+        from uinex.widget.manager import WidgetManager
+        from uinex.widget.separator import Separator
+
+        mgr = WidgetManager()
+        line = Separator(master=screen, length=40, thickness=4, color=(255, 0, 0))
+        line.place(x=0, y=10)
+        line.set_opacity(alpha)
+        mgr.register(line)
+        assert line._solid_color is None
+
+        screen.fill((0, 0, 0))
+        mgr.draw_all(screen)
+        assert abs(screen.get_at((5, 12))[0] - alpha) <= 1
+
+        screen.fill((0, 0, 0))
+        line.draw(surface=screen)
+        assert abs(screen.get_at((5, 12))[0] - alpha) <= 1
+
+        line.set_opacity(255)
+        assert line._solid_color == (255, 0, 0)
+
+    def test_draw_all_skips_widgets_outside_clip(self, screen, monkeypatch):
+        from uinex import Label
+        from uinex.widget.manager import WidgetManager
+
+        mgr = WidgetManager()
+        inside = Label(master=screen, text="In")
+        inside.place(x=10, y=10)
+        outside = Label(master=screen, text="Out")
+        outside.place(x=900, y=10)
+        mgr.register(inside)
+        mgr.register(outside)
+
+        drawn = []
+        monkeypatch.setattr(Label, "_recompose_", lambda self: drawn.append(self))
+        rects = mgr.draw_all(screen)
+
+        assert drawn == [inside]
+        assert len(rects) == 2
+
+    def test_draw_all_returns_only_changed_rects(self, screen):
+        from uinex import Frame
+        from uinex.widget.manager import WidgetManager
+
+        mgr = WidgetManager()
+        frame = Frame(master=screen, width=40, height=30)
+        frame.place(x=10, y=10)
+        mgr.register(frame)
+
+        assert mgr.draw_all(screen) == [pygame.Rect(10, 10, 40, 30)]
+        assert mgr.draw_all(screen) == []
+
+        frame.place(x=100, y=10)
+        assert mgr.draw_all(screen) == [pygame.Rect(10, 10, 130, 30)]
+
+        frame.hide()
+        assert mgr.draw_all(screen) == [pygame.Rect(100, 10, 40, 30)]
+        assert mgr.draw_all(screen) == []
+
     def test_higher_layer_drawn_last(self, screen):
         """Verify layer ordering: higher layer widgets are registered on top."""
         from uinex import Button
@@ -185,6 +365,18 @@ class TestWidgetManager:
         mgr.register(lbl)
         mgr.update_all(dt=0.016)  # Should not raise
 
+    def test_has_animations_tracks_focus(self, screen):
+        from uinex import Entry
+        from uinex.widget.manager import WidgetManager
+
+        mgr = WidgetManager()
+        entry = Entry(master=screen)
+        mgr.register(entry)
+        assert mgr.has_animations() is False
+
+        entry.focus()
+        assert mgr.has_animations() is True
+
     def test_handle_returns_bool(self, screen):
         from uinex import Button
 
@@ -222,3 +414,40 @@ class TestHandleConsumption:
         consumed = btn.handle(event)
         assert consumed is True
         assert len(results) == 1
+
+    def test_focused_key_events_reach_key_callbacks(self, screen):
+        from uinex import Button
+
+        keys = []
+        btn = Button(master=screen, text="Keys")
+        btn.on_keydown = lambda event: keys.append(("down", event.key))
+        btn.on_keyup = lambda event: keys.append(("up", event.key))
+        down = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a, "unicode": "a", "mod": 0, "scancode": 0})
+        up = pygame.event.Event(pygame.KEYUP, {"key": pygame.K_a, "unicode": "a", "mod": 0, "scancode": 0})
+
+        assert btn.handle(down) is False
+        btn.focus()
+        assert btn.handle(down) is True
+        assert btn.handle(up) is True
+        assert keys == [("down", pygame.K_a), ("up", pygame.K_a)]
+
+    def test_disabled_input_device_events_are_dropped(self, screen):
+        from uinex import Button
+        from uinex import WidgetManager
+
+        results = []
+        btn = Button(master=screen, text="Mouse")
+        btn.place(x=10, y=10)
+        btn.bind(pygame.MOUSEBUTTONDOWN, lambda: results.append(True))
+        manager = WidgetManager()
+        manager.register(btn)
+        event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (20, 20)})
+        assert btn in manager._route_(pygame.MOUSEBUTTONDOWN)
+
+        btn.mouse = False
+        assert btn not in manager._route_(pygame.MOUSEBUTTONDOWN)
+        assert btn.handle(event) is False
+        assert results == []
+
+        btn.mouse = True
+        assert btn.handle(event) is True
@@ -66,6 +66,122 @@ class TestThemeManager:
         assert ThemeManager.theme["Entry"]["focused"]["background"] == "#123456"
         assert "foreground" in ThemeManager.theme["Entry"]["focused"]
 
+    def test_load_builtin_theme_is_cached_and_isolated(self):
+        ThemeManager.load_theme("blue")
+        ThemeManager.theme["Font"]["size"] = 99
+
+        ThemeManager.load_theme("blue")
+        assert "blue" in ThemeManager._theme_cache
+        assert ThemeManager.theme["Font"]["size"] == 13
+        assert ThemeManager.theme is not ThemeManager._theme_cache["blue"]
+
+    def test_color_parses_strings_once(self):
+        from uinex.theme.manager import _parse_color
+
+        assert ThemeManager.color("#102031") == (16, 32, 49, 255)
+        hits = _parse_color.cache_info().hits
+        assert ThemeManager.color("#102031") == (16, 32, 49, 255)
+        assert _parse_color.cache_info().hits == hits + 1
+        assert ThemeManager.color(None, "#000000") == (0, 0, 0, 255)
+        assert ThemeManager.color((1, 2, 3)) == (1, 2, 3)
+
+    def test_default_theme_loads_on_first_access(self):
+        ThemeManager._theme = None
+        assert ThemeManager._currently_loaded_theme is None
+        assert ThemeManager.theme["Font"]["family"] == "Roboto"
+        assert ThemeManager._currently_loaded_theme == "blue"
+
+    def test_theme_load_parses_colors_on_demand(self):
+        from uinex.theme.manager import _parse_color
+
+        misses = _parse_color.cache_info().misses
+        ThemeManager.update_theme({"Entry": {"normal": {"background": "#0a0b0c"}}})
+        assert _parse_color.cache_info().misses == misses
+        assert ThemeManager.lookup("Entry", "normal", "background") == (10, 11, 12, 255)
+
+    def test_lookup_reads_flat_parsed_paths(self):
+        assert ThemeManager.lookup("Entry", "focused", "bordercolor") == (51, 156, 255, 255)
+        assert ThemeManager.lookup("Entry", "focused")["borderwidth"] == 2
+        assert ThemeManager.lookup("Entry", "missing", default={}) == {}
+
+        ThemeManager.update_theme({"Entry": {"focused": {"bordercolor": "#010203"}}})
+        assert ThemeManager.lookup("Entry", "focused", "bordercolor") == (1, 2, 3, 255)
+
+    def test_widget_theme_built_from_parsed_section(self, monkeypatch):
+        import pygame
+
+        from uinex.widget.base import Widget
+
+        ThemeManager.update_theme({"Widget": {"background": "#102030"}})
+        monkeypatch.setattr(ThemeManager, "_flat", None)
+        widget = Widget(width=10, height=10)
+        assert widget._theme["background"] == pygame.Color(16, 32, 48)
+        assert ThemeManager._flat is not None
+
+    def test_set_default_color_theme_defined_once(self):
+        import uinex
+
+        assert uinex.set_default_color_theme.__module__ == "uinex"
+        assert uinex.reload_theme_for_all_widgets.__module__ == "uinex"
+        assert callable(uinex._apply_theme_to_all_widgets)
+
+    def test_new_widget_subclass_reads_current_theme(self):
+        import pygame
+
+        import uinex
+        from uinex.widget.base import Widget
+
+        class Custom(Widget):
+            pass
+
+        ThemeManager.update_theme({"Custom": {"background": [7, 8, 9]}})
+        uinex.reload_theme_for_all_widgets()
+        assert Custom(width=10, height=10)._theme["background"] == pygame.Color(7, 8, 9)
+
+    def test_reload_marks_live_widgets_dirty(self):
+        import uinex
+        from uinex.widget.base import Widget
+
+        widget = Widget(width=10, height=10)
+        widget.dirty = False
+        uinex.reload_theme_for_all_widgets()
+        assert widget in Widget._instances
+        assert widget.dirty is True
+
+    def test_reload_applies_new_palette_and_keeps_overrides(self):
+        import pygame
+
+        import uinex
+        from uinex.widget.label import Label
+
+        ThemeManager.reset_theme()
+        plain = Label(text="")
+        custom = Label(text="", background=(1, 2, 3))
+        ThemeManager.update_theme({"Label": {"background": "#0a0b0c", "border_color": "#010101"}})
+        uinex.reload_theme_for_all_widgets()
+
+        assert plain._theme["background"] == pygame.Color(10, 11, 12)
+        assert plain._theme["border_color"] == pygame.Color(1, 1, 1)
+        assert custom._theme["background"] == pygame.Color(1, 2, 3)
+        assert custom._theme["border_color"] == pygame.Color(1, 1, 1)
+
+        plain._recompose_()
+        assert plain._surface.get_at((plain._surface.get_width() // 2, 1))[:3] == (10, 11, 12)
+        plain.reset_style()
+        assert plain._theme["background"] == pygame.Color(10, 11, 12)
+        ThemeManager.reset_theme()
+
+    def test_async_reload_applies_theme_to_live_widgets(self):
+        import asyncio
+
+        import uinex
+        from uinex.widget.label import Label
+
+        label = Label(text="")
+        ThemeManager.update_theme({"Label": {"background": [4, 5, 6]}})
+        asyncio.run(uinex.reload_theme_for_all_widgets_async())
+        assert label._theme["background"] == (4, 5, 6)
+
 
 @pytest.fixture(autouse=True)
 def _reset_theme_between_tests():
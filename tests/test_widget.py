@@ -1,7 +1,12 @@
+import os
+import subprocess
+import sys
+
 import pygame
 import pytest
 
 from uinex.widget.base import Widget
+from uinex.widget.base import WidgetState
 
 
 class TestWidget:
@@ -81,6 +86,18 @@ def test_widget_diable_enable(screen):
     pygame.display.flip()
 
 
+def test_widget_state_coerced_to_enum(screen):
+    """State strings should be stored as WidgetState members and unknown states rejected."""
+    from uinex.widget.base import WidgetState
+
+    widget = Widget(master=screen, width=200, height=50)
+    widget.state = "hovered"
+    assert widget.state is WidgetState.HOVERED
+    assert widget.state == "hovered"
+    with pytest.raises(ValueError):
+        widget.state = "sleeping"
+
+
 def test_widget_focus_unfocus(screen):
     """Test if the widget can be hidden and shown."""
     widget = Widget(master=screen, width=200, height=50)
@@ -181,6 +198,45 @@ def test_widget_configure_theme_and_background(screen):
     assert widget.configure("bordercolor") == (21, 22, 23)
 
 
+def test_widget_configure_reads_plain_and_subclass_attributes(screen):
+    """Item access should read base attributes, subclass attributes and unknown keys."""
+    from uinex import Label
+
+    label = Label(master=screen, text="Read", width=90)
+    assert label["width"] == 90
+    assert label["rect"] is label.rect
+    assert label["text"] == "Read"
+    assert label["hover_color"] is None
+    assert label["no_such_option"] is None
+
+
+def test_widget_colors_normalized_when_set(screen):
+    """Color values should be stored as pygame.Color so draws do not re-parse them."""
+    widget = Widget(master=screen, width=120, height=40, theme={"background": "#102030"}, shadowcolor=[1, 2, 3])
+    assert isinstance(widget.style["background"], pygame.Color)
+    assert isinstance(widget.configure("shadowcolor"), pygame.Color)
+
+    widget.set_style(border_color=(4, 5, 6), border_radius=3)
+    assert isinstance(widget.style["border_color"], pygame.Color)
+    assert widget.style["border_radius"] == 3
+
+
+def test_widget_master_resolution_by_type(screen):
+    """Rect, Surface and Widget masters resolve to the right surface and rect."""
+    from uinex import Frame
+
+    area = pygame.Rect(0, 0, 50, 50)
+    assert Widget(master=area)._master_rect is area
+    assert Widget(master=screen)._master is screen
+
+    frame = Frame(master=screen, width=40, height=40)
+    for _ in range(2):  # the second child goes through the cached resolver
+        child = Widget(master=frame, width=10, height=10)
+        assert child._master is frame.surface
+        assert child._master_rect is frame.rect
+    assert len(frame._children) == 2
+
+
 def test_widget_opacity_customization(screen):
     """Test setting and reading widget opacity."""
     widget = Widget(master=screen, width=120, height=40)
@@ -198,5 +254,264 @@ def test_widget_opacity_out_of_range_raises(screen):
         widget.set_opacity(500)
 
 
+def test_widget_surface_converted_to_display_format(screen):
+    """Widget surfaces should match the display pixel format once a display exists."""
+    widget = Widget(master=screen, width=120, height=40)
+    expected = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+    assert widget.surface.get_masks() == expected.get_masks()
+    assert widget.blit_data[0] is widget.surface
+
+
+def test_widget_blit_data_follows_surface_and_rect(screen):
+    """The prepacked (surface, rect) blit data should track surface and rect replacement."""
+    widget = Widget(master=screen, width=120, height=40)
+    assert widget.blit_data == (widget.surface, widget.rect)
+
+    widget.surface = pygame.Surface((10, 10))
+    widget.rect = pygame.Rect(5, 5, 10, 10)
+    assert widget.blit_data[0] is widget.surface
+    assert widget.blit_data[1] is widget.rect
+
+
+def test_widget_batch_draw_blits_visible_widgets(screen):
+    """batch_draw should blit every visible widget's cached surface and skip hidden ones."""
+    shown = Widget(master=screen, width=10, height=10)
+    shown.surface.fill((255, 0, 0))
+    shown.place(x=0, y=0)
+    hidden = Widget(master=screen, width=10, height=10)
+    hidden.surface.fill((0, 0, 255))
+    hidden.place(x=20, y=0)
+    hidden.hide()
+
+    screen.fill((0, 0, 0))
+    Widget.batch_draw(screen, [shown, hidden])
+    assert screen.get_at((5, 5))[:3] == (255, 0, 0)
+    assert screen.get_at((25, 5))[:3] == (0, 0, 0)
+
+
+def test_widget_outside_clip_is_not_painted(screen, monkeypatch):
+    """draw() should skip painting a widget outside the clip area but still report its area."""
+    from uinex import Label
+
+    painted = []
+    monkeypatch.setattr(Label, "_perform_draw_", lambda self, surface, *a, **k: painted.append(self))
+    label = Label(master=screen, text="Clip")
+    label.place(x=10, y=10)
+
+    screen.set_clip(pygame.Rect(400, 400, 50, 50))
+    try:
+        assert label.draw(surface=screen) == label.rect
+        assert painted == []
+    finally:
+        screen.set_clip(None)
+
+    label._dirty = True
+    label.draw(surface=screen)
+    assert painted == [label]
+
+
+def test_label_repaints_only_on_state_change(screen):
+    """A label should be marked dirty when its state changes, not on every update."""
+    from uinex import Label
+
+    label = Label(master=screen, text="Hover")
+    label.draw()
+    assert label._dirty is False
+
+    label._set_state_(WidgetState.NORMAL)
+    assert label._dirty is False
+
+    label._set_state_(WidgetState.HOVERED)
+    assert label._dirty is True
+
+
+def test_mouse_motion_over_widget_does_not_force_repaint(screen):
+    """Events only mark a widget dirty when its state or a bound handler reacts to them."""
+    from uinex import Label
+
+    label = Label(master=screen, text="Still")
+    label.place(x=10, y=10)
+    label.draw()
+    label.handle(pygame.event.Event(pygame.MOUSEMOTION, {"pos": (20, 20), "rel": (1, 1), "buttons": (0, 0, 0)}))
+    assert label._dirty is False
+
+    label.bind(pygame.MOUSEMOTION, lambda: None)
+    label.handle(pygame.event.Event(pygame.MOUSEMOTION, {"pos": (20, 20), "rel": (1, 1), "buttons": (0, 0, 0)}))
+    assert label._dirty is True
+
+
+def test_widget_uses_slots(screen):
+    """Base widgets keep their state in slots, including the geometry manager options."""
+    widget = Widget(master=screen, width=10, height=10)
+    widget.place(x=3, y=4)
+    assert not hasattr(widget, "__dict__")
+    assert widget.place_info()["x"] == 3
+
+
+def test_widget_inset_rect_reused_and_follows_placement(screen):
+    """The bare-widget draw should reuse one inset rect that tracks the widget's position."""
+    widget = Widget(master=screen, width=60, height=40)
+    inset = widget._inset_rect
+    widget.place(x=30, y=20)
+    widget.draw()
+    assert widget._inset_rect is inset
+    assert inset == widget.rect.inflate(-20, -20)
+
+
+def test_widget_geometry_defaults_from_single_init_chain(screen):
+    """One cooperative __init__ chain should set every geometry manager's defaults."""
+    from uinex.core.geometry import Grid
+    from uinex.core.geometry import Pack
+    from uinex.core.geometry import Place
+
+    assert Widget.__mro__[1:4] == (Place, Grid, Pack)
+    widget = Widget(master=screen, width=10, height=10)
+    assert widget.place_info()["relx"] == 0
+    assert widget.grid_info()["rowspan"] == 1
+    assert widget.pack_info()["expand"] is False
+
+
+def test_widget_update_passes_positional_delta(screen, monkeypatch):
+    """A positional delta should reach the widget's update hook unchanged."""
+    seen = []
+    widget = Widget(master=screen, width=10, height=10)
+    monkeypatch.setattr(widget.__class__, "_perform_update_", lambda self, delta: seen.append(delta))
+    widget.update(0.25)
+    widget.update(delta=0.5)
+    assert seen == [0.25, 0.5]
+
+
+def test_widget_update_skips_tooltip_logic_without_tooltip(screen, monkeypatch):
+    """Only widgets with tooltip text should run the per-frame tooltip hover check."""
+    from uinex import Label
+
+    checked = []
+    monkeypatch.setattr(Widget, "_update_tooltip_", lambda self, pos, delta: checked.append(self))
+    plain = Label(master=screen, text="Plain")
+    tipped = Label(master=screen, text="Tip", tooltip="Hint")
+    plain.update(0.1)
+    tipped.update(0.1)
+    assert checked == [tipped]
+
+
+def test_widget_after_queue_shares_empty_default(screen):
+    """Widgets should share the empty after-queue until a callback is scheduled."""
+    calls = []
+    first = Widget(master=screen, width=10, height=10)
+    second = Widget(master=screen, width=10, height=10)
+    assert first._after_queue is second._after_queue
+    first.after(0, lambda: calls.append(True))
+    assert second._after_queue == ()
+    first._process_after_queue()
+    assert calls == [True]
+    assert first._after_queue == ()
+
+
+def test_widget_geometry_setters_validate_options(screen):
+    """Geometry option setters should accept known values and reject others."""
+    widget = Widget(master=screen, width=10, height=10)
+    widget.side = "left"
+    widget.fill = "both"
+    widget.bordermode = "outside"
+    assert (widget.side, widget.fill, widget.bordermode) == ("left", "both", "outside")
+    for option, value in (("side", "middle"), ("fill", "diagonal"), ("bordermode", "ignore")):
+        with pytest.raises(ValueError):
+            setattr(widget, option, value)
+
+
+def test_widget_place_anchor_accepts_any_value(screen):
+    """Place.anchor stays unvalidated, as it always was; unknown anchors leave the rect unmoved."""
+    widget = Widget(master=screen, width=10, height=10)
+    widget.anchor = None
+    assert widget.anchor is None
+    widget.place(x=5, y=6)
+    assert widget.rect.topleft == (5, 6)
+
+
+def test_widget_grid_cell_size_follows_grid_size(screen):
+    """Cached grid cell sizes should be recomputed after the grid size changes."""
+    from uinex.core.geometry import Grid
+
+    widget = Widget(master=screen, width=10, height=10)
+    try:
+        widget.grid(row=1, column=1)
+        assert widget.rect.topleft == (800 // 3, 600 // 3)
+        Grid.set_grid_size(4, 4)
+        widget.grid(row=1, column=1)
+        assert widget.rect.topleft == (200, 150)
+        Grid.num_rows, Grid.num_columns = 2, 5
+        widget.grid(row=1, column=1)
+        assert widget.rect.topleft == (160, 300)
+    finally:
+        Grid.reset_grid_size()
+
+
+def test_widget_repeated_layout_is_skipped(screen):
+    """Repeating a layout call with unchanged inputs should leave the widget clean."""
+    widget = Widget(master=screen, width=100, height=40)
+    widget.pack(ipadx=5, padx=10)
+    size = widget.rect.size
+    widget._dirty = False
+    widget.pack(ipadx=5, padx=10)
+    assert widget.rect.size == size
+    assert widget._dirty is False
+    widget.pack(ipadx=5, padx=20)
+    assert widget._dirty is True
+
+
+def test_widget_configure_layout_options(screen):
+    """configure() should validate layout options together and expose them for reading."""
+    widget = Widget(master=screen, width=10, height=10)
+    widget.configure(side="left", padx=4, row=2)
+    assert (widget.configure("side"), widget.configure("padx"), widget.configure("row")) == ("left", 4, 2)
+    with pytest.raises(ValueError):
+        widget.configure(side="right", rowspan=0)
+    assert widget.configure("side") == "left"
+
+
+def test_widget_place_relative(screen):
+    """Relative placement should truncate to whole pixels of the master size."""
+    widget = Widget(master=screen, width=10, height=10)
+    widget.place(x=5, relx=0.333, rely=0.5, relwidth=0.25)
+    assert widget.rect.topleft == (5 + int(800 * 0.333), 300)
+    assert widget.rect.size == (200, 10)
+
+
+def test_widget_pack_fill_and_expand(screen):
+    """Fill and expand should stretch the axes implied by the pack side."""
+    widget = Widget(master=screen, width=100, height=40)
+    widget.pack(side="top", fill="x", anchor="nw", padx=10)
+    assert widget.rect.size == (780, 40)
+    other = Widget(master=screen, width=100, height=40)
+    other.pack(side="left", expand=True, anchor="se", pady=5)
+    assert other.rect.size == (100, 590)
+    assert other.rect.bottomright == (800, 600)
+
+
+def test_label_surface_follows_stretched_rect(screen):
+    """A label stretched by its geometry manager should repaint its whole area."""
+    from uinex import Label
+
+    label = Label(master=screen, width=100, height=40, text="Wide", background=(0, 200, 0))
+    label.pack(side="top", fill="x", padx=5)
+    screen.fill((0, 0, 0))
+    label.draw()
+    assert label._surface.get_size() == label.rect.size
+    assert label.blit_data == (label._surface, label._rect)
+    assert screen.get_at((label.rect.right - 10, label.rect.centery))[:3] == (0, 200, 0)
+
+
+def test_package_imports_widget_modules_lazily():
+    """Importing uinex should not load widget modules until they are accessed."""
+    code = (
+        "import sys, uinex; "
+        "assert 'uinex.widget.treeview' not in sys.modules; "
+        "uinex.TreeView; "
+        "assert 'uinex.widget.treeview' in sys.modules"
+    )
+    env = {**os.environ, "SDL_VIDEODRIVER": "dummy"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env, capture_output=True)
+
+
 if __name__ == "__main__":
     pytest.main(["-v", "--tb=short", __file__])
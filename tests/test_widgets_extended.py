@@ -77,6 +77,18 @@ class TestButton:
         btn.update(delta=0.016)
         btn.draw(surface=screen)
 
+    def test_state_change_marks_dirty_once(self, screen):
+        from uinex import Button
+
+        btn = Button(master=screen, text="State")
+        btn.draw(surface=screen)
+        btn._set_state_("hovered")
+        assert btn.dirty is True
+
+        btn.draw(surface=screen)
+        btn._set_state_("hovered")
+        assert btn.dirty is False
+
     def test_configure_get_text(self, screen):
         from uinex import Button
 
@@ -141,6 +153,59 @@ class TestLabel:
         lbl.update(delta=0.016)
         lbl.draw(surface=screen)  # should not raise
 
+    def test_given_font_skips_theme_font_lookup(self, screen, monkeypatch):
+        from uinex import Label
+
+        font = pygame.font.Font(None, 20)
+        monkeypatch.setattr(pygame.font, "SysFont", lambda *a, **k: pytest.fail("SysFont called"))
+        lbl = Label(master=screen, text="Font", font=font)
+        assert lbl._font is font
+
+    def test_square_label_background_filled(self, screen):
+        from uinex import Label
+
+        lbl = Label(master=screen, text="", background=(0, 0, 200))
+        lbl._recompose_()
+        assert lbl._surface.get_at((0, 0)) == (0, 0, 200, 255)
+
+    def test_tiny_label_skips_text_render(self, screen):
+        from uinex import Label
+
+        lbl = Label(master=screen, text="Hidden", width=2, height=2)
+        lbl._recompose_()
+        assert lbl._text_cache == {}
+
+    def test_text_render_cached_between_frames(self, screen):
+        from uinex import Label
+
+        lbl = Label(master=screen, text="Cached")
+        lbl.place(x=10, y=10)
+        lbl.draw(surface=screen)
+        lbl.draw(surface=screen)
+        assert len(lbl._text_cache) == 1
+
+        lbl.set_text("Changed")
+        lbl.draw(surface=screen)
+        assert len(lbl._text_cache) == 2
+
+    def test_clean_label_blits_cached_surface(self, screen, monkeypatch):
+        from uinex import Label
+
+        lbl = Label(master=screen, text="Static", background=(0, 200, 0))
+        lbl.place(x=10, y=10)
+        lbl.draw(surface=screen)
+
+        rendered = []
+        monkeypatch.setattr(lbl, "_render_text_", lambda *args: rendered.append(args) or pygame.Surface((1, 1)))
+        screen.fill((0, 0, 0))
+        lbl.draw(surface=screen)
+        assert rendered == []
+        assert screen.get_at((15, 15))[:3] == (0, 200, 0)
+
+        lbl.set_text("Changed")
+        lbl.draw(surface=screen)
+        assert len(rendered) == 1
+
     def test_hide_show(self, screen):
         from uinex import Label
 
@@ -347,6 +412,24 @@ class TestDialog:
                 ev = pygame.event.Event(event_type)
             assert dlg.handle(ev) is True
 
+    def test_button_click_hit_tests_button_rects(self, screen):
+        from uinex.widget.dialog import Dialog
+
+        results = []
+        dlg = Dialog(master=screen, title="T", message="M", buttons=["Yes", "No"], on_close=results.append)
+        dlg.show()
+        rect = dlg._button_rects[1]
+        motion = pygame.event.Event(pygame.MOUSEMOTION, {"pos": rect.center, "rel": (0, 0), "buttons": (0, 0, 0)})
+        dlg.handle(motion)
+        assert dlg._hovered_btn == 1
+        dlg.handle(pygame.event.Event(pygame.MOUSEMOTION, {"pos": (0, 0), "rel": (0, 0), "buttons": (0, 0, 0)}))
+        assert dlg._hovered_btn is None
+        dlg.handle(pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": rect.bottomright}))
+        assert dlg._pressed_btn is None  # bottomright lies just outside the rect
+        dlg.handle(pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": rect.center}))
+        dlg.handle(pygame.event.Event(pygame.MOUSEBUTTONUP, {"button": 1, "pos": rect.center}))
+        assert results == ["No"]
+
     def test_invisible_dialog_does_not_consume(self, screen):
         from uinex.widget.dialog import Dialog
 
@@ -364,6 +447,171 @@ class TestDialog:
         dlg.update(delta=0.016)
         dlg.draw(surface=screen)
 
+    def test_overlay_surface_reused_between_frames(self, screen):
+        from uinex.widget.dialog import Dialog
+
+        dlg = Dialog(master=screen, title="T", message="M")
+        dlg.show()
+        dlg.draw(surface=screen)
+        overlay = dlg._overlay
+        dlg.draw(surface=screen)
+        assert dlg._overlay is overlay
+        assert overlay.get_size() == screen.get_size()
+
+
+# ---------------------------------------------------------------------------
+# Progressbar tests
+# ---------------------------------------------------------------------------
+
+
+class TestProgressbar:
+    def test_text_rect_reused_until_text_or_position_changes(self, screen):
+        from uinex.widget.progress import Progressbar
+
+        bar = Progressbar(master=screen, value=50)
+        bar.place(x=10, y=10)
+        bar.draw(surface=screen)
+        blit = bar._text_blit
+        bar.draw(surface=screen)
+        assert bar._text_blit is blit
+
+        bar.place(x=40, y=10)
+        bar.draw(surface=screen)
+        assert bar._text_blit[1].center == bar.rect.center
+
+        bar.set(75)
+        bar.draw(surface=screen)
+        assert bar._text_blit[0] is not blit[0]
+
+    def test_chrome_painted_once_until_size_changes(self, screen):
+        from uinex.widget.progress import Progressbar
+
+        bar = Progressbar(master=screen, value=50, border_radius=4)
+        bar.place(x=10, y=10)
+        bar.draw(surface=screen)
+        chrome = bar._chrome
+        assert chrome.get_size() == bar.rect.size
+
+        bar.set(20)
+        bar.draw(surface=screen)
+        assert bar._chrome is chrome
+
+        bar.rect.width = 120
+        bar.draw(surface=screen)
+        assert bar._chrome is not chrome
+        assert bar._chrome.get_size() == bar.rect.size
+
+    def test_square_bar_filled_without_chrome(self, screen):
+        from uinex.widget.progress import Progressbar
+
+        bar = Progressbar(master=screen, value=0)
+        bar.place(x=10, y=10)
+        screen.fill((0, 0, 0))
+        bar.draw(surface=screen)
+        assert bar._chrome is None
+        assert screen.get_at((11, 11))[:3] == bar._theme["background"][:3]
+
+    def test_fill_rect_updated_in_place(self, screen):
+        from uinex.widget.progress import Progressbar
+
+        bar = Progressbar(master=screen, length=200, thickness=20, value=50)
+        bar.place(x=10, y=10)
+        fill_rect = bar._fill_rect
+        bar.draw(surface=screen)
+        assert bar._fill_rect is fill_rect
+        assert fill_rect == pygame.Rect(10, 10, 100, 20)
+
+        bar.set(25)
+        bar.draw(surface=screen)
+        assert bar._fill_rect is fill_rect
+        assert fill_rect.width == 50
+
+
+# ---------------------------------------------------------------------------
+# Meter tests
+# ---------------------------------------------------------------------------
+
+
+class TestMeter:
+    def test_circular_arc_points_reused_until_value_changes(self, screen):
+        from uinex.widget.progress import Meter
+
+        meter = Meter(master=screen, value=50)
+        meter.place(x=10, y=10)
+        meter.draw(surface=screen)
+        points = meter._arc_points
+        meter.draw(surface=screen)
+        assert meter._arc_points is points
+
+        meter.set(75)
+        meter.draw(surface=screen)
+        assert meter._arc_points is not points
+        assert len(meter._arc_points) > len(points)
+
+
+# ---------------------------------------------------------------------------
+# Frame tests
+# ---------------------------------------------------------------------------
+
+
+class TestFrame:
+    def test_children_painted_on_backing_surface_only_when_changed(self, screen, monkeypatch):
+        from uinex import Frame
+        from uinex import Label
+
+        frame = Frame(master=screen, width=100, height=60)
+        frame.place(x=20, y=20)
+        label = Label(master=frame, text="Child")
+        label.place(x=5, y=5)
+        assert frame._children == [label]
+
+        painted = []
+        original = Label._recompose_
+        monkeypatch.setattr(Label, "_recompose_", lambda self: painted.append(self) or original(self))
+
+        frame.draw(surface=screen)
+        assert painted == [label]
+        frame.draw(surface=screen)
+        assert len(painted) == 1
+
+        label.text = "Changed"
+        frame.draw(surface=screen)
+        assert len(painted) == 2
+
+    def test_nested_frame_repaints_when_grandchild_changes(self, screen):
+        from uinex import Frame
+        from uinex import Label
+
+        outer = Frame(master=screen, width=100, height=60)
+        outer.place(x=0, y=0)
+        inner = Frame(master=outer, width=80, height=40)
+        inner.place(x=0, y=0)
+        label = Label(master=inner, text="", width=20, height=20, background=(0, 0, 255))
+        label.place(x=0, y=0)
+        outer.draw(surface=screen)
+
+        label.configure(background=(255, 0, 0))
+        outer.update()
+        outer.draw(surface=screen)
+        assert screen.get_at((5, 5))[:3] == (255, 0, 0)
+
+    def test_composited_children_blitted_in_one_batch(self, screen, monkeypatch):
+        from uinex import Frame
+        from uinex import Label
+        from uinex.widget import frame as frame_module
+
+        frame = Frame(master=screen, width=100, height=60)
+        first = Label(master=frame, text="A", width=20, height=20)
+        first.place(x=0, y=0)
+        second = Label(master=frame, text="B", width=20, height=20)
+        second.place(x=30, y=0)
+
+        batches = []
+        monkeypatch.setattr(frame_module, "blit_batch", lambda target, seq, flags=0: batches.append(list(seq)))
+        frame.draw(surface=screen)
+        assert batches == [[first.blit_data, second.blit_data]]
+        assert not first._dirty and not second._dirty
+
 
 # ---------------------------------------------------------------------------
 # Theme tests
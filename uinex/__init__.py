@@ -82,6 +82,9 @@ Author: Sackey Ezekiel Etrue (https://github.com/djoezeke) & Uinex Contributors
 License: MIT
 """
 
+import asyncio
+import importlib
+
 from uinex.utils.version import vernum
 
 __version__ = str(vernum)
@@ -92,30 +95,34 @@ from uinex.core.events import UIEventDispatcher
 # Base Class
 # Theme/Manager Classes
 from uinex.theme import ThemeManager
+
+# Widget Classes: Widget is eager, the rest load on first access (PEP 562)
+from uinex.widget import _LAZY_WIDGETS
 from uinex.widget.base import Widget
 
-# Widget Classes
-from uinex.widget.boxes import ComboBox
-from uinex.widget.boxes import ListBox
-from uinex.widget.boxes import SpinBox
-from uinex.widget.boxes import TextBox
-from uinex.widget.buttons import Button
-from uinex.widget.buttons import CheckButton
-from uinex.widget.buttons import MenuButton
-from uinex.widget.buttons import RadioButton
-from uinex.widget.dialog import Dialog
-from uinex.widget.frame import Frame
-from uinex.widget.inputs import Entry
-from uinex.widget.label import Label
-from uinex.widget.manager import WidgetManager
-from uinex.widget.progress import Floodgauge
-from uinex.widget.progress import Meter
-from uinex.widget.progress import Progressbar
-from uinex.widget.scale import Scale
-from uinex.widget.separator import Separator
-from uinex.widget.sizegrip import SizeGrip
-from uinex.widget.tooltip import Tooltip
-from uinex.widget.treeview import TreeView
+__all__ = [
+    "UIEventDispatcher",
+    "ThemeManager",
+    "Widget",
+    *_LAZY_WIDGETS,
+    "set_default_color_theme",
+    "reload_theme_for_all_widgets",
+    "reload_theme_for_all_widgets_async",
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_WIDGETS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_WIDGETS))
+
 
 # Utility Functions
 
@@ -133,35 +140,14 @@ def set_default_color_theme(color_string: str):
 
 def _apply_theme_to_all_widgets():
     """
-    Apply the loaded theme to all registered widget classes.
+    Apply the loaded theme to all live widgets.
     This ensures all widgets update their appearance when the theme changes.
+
+    New widgets read the current theme when they are created; live widgets
+    rebuild their theme from it and repaint on their next draw.
     """
-    widget_classes = [
-        Widget,
-        Frame,
-        Label,
-        Entry,
-        Meter,
-        Scale,
-        Button,
-        TextBox,
-        SpinBox,
-        ListBox,
-        SizeGrip,
-        TreeView,
-        ComboBox,
-        Separator,
-        MenuButton,
-        Floodgauge,
-        CheckButton,
-        RadioButton,
-        Progressbar,
-        Tooltip,
-        Dialog,
-    ]
-    for widget_cls in widget_classes:
-        if hasattr(widget_cls, "set_theme") and callable(widget_cls.set_theme):
-            widget_cls.set_theme(ThemeManager.theme)
+    for widget in list(Widget._instances):
+        widget._invalidate_style_()
 
 
 def reload_theme_for_all_widgets():
@@ -170,3 +156,15 @@ def reload_theme_for_all_widgets():
     Call this after changing the theme to ensure all widgets reflect the new styles.
     """
     _apply_theme_to_all_widgets()
+
+
+async def reload_theme_for_all_widgets_async():
+    """
+    Apply the current theme to all widgets, yielding to the event loop between widgets.
+
+    Use this from an asyncio-driven main loop so a theme switch is spread over
+    several loop iterations instead of stalling a single frame.
+    """
+    for widget in list(Widget._instances):
+        await asyncio.sleep(0)
+        widget._invalidate_style_()
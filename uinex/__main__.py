@@ -13,13 +13,23 @@ import sys
 
 import pygame
 
+BACKGROUND_COLOR = (50, 50, 50)
+
+_initialized: bool = False  # Set once pygame and its font module are up
+
 
 def initialize_pygame():
     """
     Initialize Pygame and its font module.
+
+    Repeated calls (e.g. ``main()`` run more than once) skip SDL initialization.
     """
+    global _initialized
+    if _initialized:
+        return
     pygame.init()
     pygame.font.init()
+    _initialized = True
 
 
 def create_window(width: int = 800, height: int = 600) -> pygame.Surface:
@@ -44,6 +54,7 @@ def main():
 
     Handles the main event loop and window updates.
     """
+    global _initialized
     initialize_pygame()
 
     # If run as a module, adjust sys.argv[0] for clarity in error messages.
@@ -51,21 +62,30 @@ def main():
         sys.argv[0] = "python -m uinex"
 
     window = create_window()
+    clock = pygame.time.Clock()
 
+    needs_redraw = True
     running = True
     while running:
-        for event in pygame.event.get():
+        # Nothing animates, so sleep until the next event arrives
+        for event in [pygame.event.wait(), *pygame.event.get()]:
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                needs_redraw = True
 
-        # Fill the screen with a background color
-        window.fill((50, 50, 50))
+        if needs_redraw:
+            # Fill the screen with a background color
+            window.fill(BACKGROUND_COLOR)
 
-        # TODO: Add UI widgets or demo content here
+            # TODO: Add UI widgets or demo content here
 
-        pygame.display.flip()
+            pygame.display.flip()
+            needs_redraw = False
+        clock.tick(60)
 
     pygame.quit()
+    _initialized = False  # pygame.quit() undoes the initialization
     sys.exit()
 
 
@@ -169,14 +169,21 @@ class UIEventDispatcher:
         for widget in self._widgets:
             widget.update(delta=dt)
 
-    def draw_all(self, surface: pygame.Surface) -> None:
+    def draw_all(self, surface: pygame.Surface) -> list[pygame.Rect]:
         """Call ``draw()`` on every registered widget.
 
         Args:
             surface: The surface to draw on.
+
+        Returns:
+            The areas changed since the previous call, for ``pygame.display.update``.
         """
+        dirty_rects = []
         for widget in self._widgets:
-            widget.draw(surface=surface)
+            rect = widget.draw(surface=surface)
+            if rect is not None:
+                dirty_rects.append(rect)
+        return dirty_rects
 
     # ─────────────────────────────────────────────────
     # Dunder helpers
@@ -13,6 +13,10 @@ Author: Sackey Ezekiel Etrue (https://github.com/djoezeke) & Uinex Library Contr
 License: MIT
 """
 
+import functools
+import operator
+from collections.abc import Callable
+from typing import Any
 from typing import Literal
 
 __all__ = ["Pack", "Grid", "Place"]
@@ -25,6 +29,171 @@ type Side = Literal["left", "right", "top", "bottom"]
 type ScreenUnits = int | float
 type Fill = Literal["none", "x", "y", "both"]
 
+# Accepted option values, shared by the validating setters
+_ANCHORS = frozenset({"n", "s", "e", "w", "ne", "nw", "se", "sw", "center"})
+_FILLS = frozenset({"none", "x", "y", "both"})
+_SIDES = frozenset({"top", "bottom", "left", "right"})
+_BORDERMODES = frozenset({"inside", "outside"})
+
+# Groupings used by Pack to pick which axis fill/expand act on
+_XFILLS = frozenset({"x", "both"})
+_YFILLS = frozenset({"y", "both"})
+_VSIDES = frozenset({"top", "bottom"})
+_HSIDES = frozenset({"left", "right"})
+
+
+# region Layout tables
+
+
+def _position_top(rect, mw: int, mh: int, padx: ScreenUnits, pady: ScreenUnits) -> None:
+    rect.topleft = (padx, pady)
+
+
+def _position_bottom(rect, mw: int, mh: int, padx: ScreenUnits, pady: ScreenUnits) -> None:
+    rect.topleft = (padx, mh - rect.height - pady)
+
+
+def _position_right(rect, mw: int, mh: int, padx: ScreenUnits, pady: ScreenUnits) -> None:
+    rect.topleft = (mw - rect.width - padx, pady)
+
+
+# ``side`` -> function placing the rect against that side of its master
+_SIDE_POSITIONS = {
+    "top": _position_top,
+    "bottom": _position_bottom,
+    "left": _position_top,
+    "right": _position_right,
+}
+
+# Whether (side, fill, expand) stretches the width and/or the height to the master
+_STRETCH: dict[tuple[str, str, bool], tuple[bool, bool]] = {
+    (side, fill, expand): (
+        fill in _XFILLS or (expand and side in _VSIDES),
+        fill in _YFILLS or (expand and side in _HSIDES),
+    )
+    for side in _SIDES
+    for fill in _FILLS
+    for expand in (False, True)
+}
+_NO_STRETCH = (False, False)
+
+# ``anchor`` -> Rect attribute naming that point
+_ANCHOR_POINTS = {
+    "center": "center",
+    "n": "midtop",
+    "s": "midbottom",
+    "e": "midright",
+    "w": "midleft",
+    "ne": "topright",
+    "nw": "topleft",
+    "se": "bottomright",
+    "sw": "bottomleft",
+}
+
+
+# endregion
+
+
+# region Option validation
+
+
+# ``0 <= value`` / ``1 <= value`` as C-level callables, so the common valid path
+# runs no Python bytecode. ``(0).__le__`` would return NotImplemented for floats.
+_non_negative = functools.partial(operator.le, 0)
+_positive = functools.partial(operator.le, 1)
+
+
+def _unit_interval(value) -> bool:
+    return 0.0 <= value <= 1.0
+
+
+def _is_bool(value) -> bool:
+    return isinstance(value, bool)
+
+
+# option -> (check, error message); one table validates any mix of layout options
+_OPTION_CHECKS: dict[str, tuple[Callable[[Any], bool], str]] = {
+    "anchor": (_ANCHORS.__contains__, "Anchor must be one of NSEW or a combination thereof"),
+    "expand": (_is_bool, "Expand must be a boolean value"),
+    "fill": (_FILLS.__contains__, "Fill must be 'none', 'x', 'y', or 'both'"),
+    "side": (_SIDES.__contains__, "Side must be 'top', 'bottom', 'left', or 'right'"),
+    "ipadx": (_non_negative, "Internal padding in x direction must be a non-negative integer"),
+    "ipady": (_non_negative, "Internal padding in y direction must be a non-negative integer"),
+    "padx": (_non_negative, "Padding in x direction must be a non-negative integer"),
+    "pady": (_non_negative, "Padding in y direction must be a non-negative integer"),
+    "row": (_non_negative, "Row must be a non-negative integer"),
+    "column": (_non_negative, "Column must be a non-negative integer"),
+    "rowspan": (_positive, "Row span must be a positive integer"),
+    "columnspan": (_positive, "Column span must be a positive integer"),
+    "relx": (_unit_interval, "relx must be between 0.0 and 1.0"),
+    "rely": (_unit_interval, "rely must be between 0.0 and 1.0"),
+    "relwidth": (_unit_interval, "relwidth must be between 0.0 and 1.0"),
+    "relheight": (_unit_interval, "relheight must be between 0.0 and 1.0"),
+    "bordermode": (_BORDERMODES.__contains__, "bordermode must be 'inside' or 'outside'"),
+}
+
+# Layout options accepted by ``set_layout_options``; ``bordermode`` doubles as a
+# widget border option and is configured with those instead
+LAYOUT_OPTIONS = frozenset(_OPTION_CHECKS) - {"bordermode"}
+
+
+def set_layout_options(target: Any, options: dict[str, Any]) -> None:
+    """
+    Validate and store several layout options in one pass.
+
+    Every value is checked before any is stored, so a bad option leaves
+    *target* unchanged.
+
+    Args:
+        target: Widget (or other Pack/Grid/Place user) to update.
+        options (dict): Option name -> value, names from ``LAYOUT_OPTIONS``.
+
+    Raises:
+        ValueError: If an option is unknown or its value is invalid.
+    """
+    for name, value in options.items():
+        check = _OPTION_CHECKS.get(name)
+        if check is None:
+            raise ValueError(f"Unknown layout option {name!r}")
+        if not check[0](value):
+            raise ValueError(check[1])
+    for name, value in options.items():
+        setattr(target, "_" + name, value)
+
+
+class _Option:
+    """
+    Layout option property stored on ``_<name>``.
+
+    Values are checked against ``_OPTION_CHECKS`` when the option has an entry
+    there and *validate* is true; other options (such as ``x``/``y``) are
+    stored as given.
+    """
+
+    def __init__(self, doc: str, validate: bool = True):
+        self.__doc__ = doc
+        self._attr: str = ""
+        self._validate = validate
+        self._check: tuple[Callable[[Any], bool], str] | None = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = "_" + name
+        self._check = _OPTION_CHECKS.get(name) if self._validate else None
+
+    def __get__(self, obj: Any, owner: type | None = None) -> Any:
+        if obj is None:
+            return self
+        return getattr(obj, self._attr)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        check = self._check
+        if check is not None and not check[0](value):
+            raise ValueError(check[1])
+        setattr(obj, self._attr, value)
+
+
+# endregion
+
 
 class Pack:
     """
@@ -45,6 +214,13 @@ class Pack:
         _pady (int or tuple): External padding (y).
     """
 
+    # Storage is declared by the widget class that combines the managers
+    __slots__ = ()
+
+    # Fallbacks for classes that never set these, so layout can read them directly
+    _master = None
+    _rect = None
+
     def __init__(self):
         """
         Initialize packing options to defaults.
@@ -57,112 +233,19 @@ class Pack:
         self._expand: bool | Literal[0, 1] = False
         self._padx: ScreenUnits | tuple[ScreenUnits, ScreenUnits] = 0
         self._pady: ScreenUnits | tuple[ScreenUnits, ScreenUnits] = 0
+        self._layout_key: tuple | None = None  # (inputs, resulting rect) of the last layout
+        super().__init__()
 
     # region Properties
 
-    @property
-    def anchor(self) -> str | None:
-        """
-        Anchor position of the widget (e.g., 'n', 's', 'e', 'w', 'center').
-        """
-        return self._anchor
-
-    @anchor.setter
-    def anchor(self, value: str):
-        if value not in ("n", "s", "e", "w", "ne", "nw", "se", "sw", "center"):
-            raise ValueError("Anchor must be one of NSEW or a combination thereof")
-        self._anchor = value
-
-    @property
-    def expand(self) -> bool:
-        """
-        Whether the widget should expand when the parent grows.
-        """
-        return self._expand
-
-    @expand.setter
-    def expand(self, value: bool):
-        if not isinstance(value, bool):
-            raise ValueError("Expand must be a boolean value")
-        self._expand = value
-
-    @property
-    def fill(self) -> str | None:
-        """
-        How the widget should fill the available space ('none', 'x', 'y', 'both').
-        """
-        return self._fill
-
-    @fill.setter
-    def fill(self, value: str):
-        if value not in ("none", "x", "y", "both"):
-            raise ValueError("Fill must be 'none', 'x', 'y', or 'both'")
-        self._fill = value
-
-    @property
-    def side(self) -> str | None:
-        """
-        Side of the parent widget where the widget should be placed.
-        """
-        return self._side
-
-    @side.setter
-    def side(self, value: str):
-        if value not in ("top", "bottom", "left", "right"):
-            raise ValueError("Side must be 'top', 'bottom', 'left', or 'right'")
-        self._side = value
-
-    @property
-    def ipadx(self) -> int:
-        """
-        Internal padding in the x direction.
-        """
-        return self._ipadx
-
-    @ipadx.setter
-    def ipadx(self, value: int):
-        if value < 0:
-            raise ValueError("Internal padding in x direction must be a non-negative integer")
-        self._ipadx = value
-
-    @property
-    def ipady(self) -> int:
-        """
-        Internal padding in the y direction.
-        """
-        return self._ipady
-
-    @ipady.setter
-    def ipady(self, value: int):
-        if value < 0:
-            raise ValueError("Internal padding in y direction must be a non-negative integer")
-        self._ipady = value
-
-    @property
-    def padx(self) -> int | tuple:
-        """
-        External padding in the x direction.
-        """
-        return self._padx
-
-    @padx.setter
-    def padx(self, value: int):
-        if value < 0:
-            raise ValueError("Padding in x direction must be a non-negative integer")
-        self._padx = value
-
-    @property
-    def pady(self) -> int | tuple:
-        """
-        External padding in the y direction.
-        """
-        return self._pady
-
-    @pady.setter
-    def pady(self, value: int):
-        if value < 0:
-            raise ValueError("Padding in y direction must be a non-negative integer")
-        self._pady = value
+    anchor = _Option("Anchor position of the widget (e.g., 'n', 's', 'e', 'w', 'center').")
+    expand = _Option("Whether the widget should expand when the parent grows.")
+    fill = _Option("How the widget should fill the available space ('none', 'x', 'y', 'both').")
+    side = _Option("Side of the parent widget where the widget should be placed.")
+    ipadx = _Option("Internal padding in the x direction.")
+    ipady = _Option("Internal padding in the y direction.")
+    padx = _Option("External padding in the x direction.")
+    pady = _Option("External padding in the y direction.")
 
     # endregion Properties
 
@@ -206,65 +289,45 @@ class Pack:
         self._padx = padx
         self._pady = pady
 
-        master = getattr(self, "_master", None)
-        rect = getattr(self, "_rect", None)
+        master = self._master
+        rect = self._rect
         if master is None or rect is None:
             return
 
+        # Query the master size once; every branch below reuses it
+        mw, mh = master.get_size()
+
+        # Re-applying the same options to the rect this call produced last time
+        # is a no-op, so skip the layout (and the repaint it would trigger)
+        key = ("pack", mw, mh, self._side, self._anchor, self._fill, self._expand, ipadx, ipady, padx, pady)
+        if self._layout_key == (key, tuple(rect)):
+            return
+        self._dirty = True
+
         # Calculate padding
         padx = self._padx if isinstance(self._padx, (int, float)) else sum(self._padx)
         pady = self._pady if isinstance(self._pady, (int, float)) else sum(self._pady)
         ipadx = self._ipadx or 0
         ipady = self._ipady or 0
 
-        # Fill and expand
-        if self._fill in ("x", "both"):
-            rect.width = master.get_width() - 2 * padx
-        if self._fill in ("y", "both"):
-            rect.height = master.get_height() - 2 * pady
-        if self._expand:
-            if self._side in ("top", "bottom"):
-                rect.width = master.get_width() - 2 * padx
-            elif self._side in ("left", "right"):
-                rect.height = master.get_height() - 2 * pady
-
-        # Internal padding
-        rect.width += 2 * ipadx
-        rect.height += 2 * ipady
+        # Fill and expand, then internal padding, applied in one resize
+        stretch_x, stretch_y = _STRETCH.get((self._side, self._fill, bool(self._expand)), _NO_STRETCH)
+        rect.size = (
+            (mw - 2 * padx if stretch_x else rect.width) + 2 * ipadx,
+            (mh - 2 * pady if stretch_y else rect.height) + 2 * ipady,
+        )
 
         # Positioning based on side
-        if self._side == "top":
-            rect.x = padx
-            rect.y = pady
-        elif self._side == "bottom":
-            rect.x = padx
-            rect.y = master.get_height() - rect.height - pady
-        elif self._side == "left":
-            rect.x = padx
-            rect.y = pady
-        elif self._side == "right":
-            rect.x = master.get_width() - rect.width - padx
-            rect.y = pady
+        position = _SIDE_POSITIONS.get(self._side)
+        if position is not None:
+            position(rect, mw, mh, padx, pady)
 
         # Anchor adjustment (center, n, s, e, w, etc.)
-        if self._anchor == "center":
-            rect.center = master.get_rect().center
-        elif self._anchor == "n":
-            rect.midtop = master.get_rect().midtop
-        elif self._anchor == "s":
-            rect.midbottom = master.get_rect().midbottom
-        elif self._anchor == "e":
-            rect.midright = master.get_rect().midright
-        elif self._anchor == "w":
-            rect.midleft = master.get_rect().midleft
-        elif self._anchor == "ne":
-            rect.topright = master.get_rect().topright
-        elif self._anchor == "nw":
-            rect.topleft = master.get_rect().topleft
-        elif self._anchor == "se":
-            rect.bottomright = master.get_rect().bottomright
-        elif self._anchor == "sw":
-            rect.bottomleft = master.get_rect().bottomleft
+        point = _ANCHOR_POINTS.get(self._anchor)
+        if point is not None:
+            setattr(rect, point, getattr(master.get_rect(), point))
+
+        self._layout_key = (key, tuple(rect))
 
     def pack_info(self) -> dict:
         """
@@ -301,6 +364,17 @@ class Grid:
     num_rows = 3
     num_columns = 3
 
+    # ((master width, master height), rows, columns) -> (cell width, cell height);
+    # keyed on the grid size too, so assigning num_rows/num_columns directly is safe
+    _cell_cache: dict[tuple[tuple[int, int], int, int], tuple[int, int]] = {}
+
+    # Storage is declared by the widget class that combines the managers
+    __slots__ = ()
+
+    # Fallbacks for classes that never set these, so layout can read them directly
+    _master = None
+    _rect = None
+
     def __init__(self):
         """Initialize grid options to None."""
         self._row: int = 0
@@ -312,96 +386,19 @@ class Grid:
         self._sticky: Literal["n", "s", "w", "e"] = None
         self._padx: ScreenUnits | tuple[ScreenUnits, ScreenUnits] = 0
         self._pady: ScreenUnits | tuple[ScreenUnits, ScreenUnits] = 0
+        self._layout_key: tuple | None = None  # (inputs, resulting rect) of the last layout
+        super().__init__()
 
     # region Properties
 
-    @property
-    def column(self):
-        """Column of the widget in the grid."""
-        return self._column
-
-    @column.setter
-    def column(self, value: int):
-        if value < 0:
-            raise ValueError("Column must be a non-negative integer")
-        self._column = value
-
-    @property
-    def columnspan(self):
-        """Column span of the widget in the grid."""
-        return self._columnspan
-
-    @columnspan.setter
-    def columnspan(self, value: int):
-        if value < 1:
-            raise ValueError("Column span must be a positive integer")
-        self._columnspan = value
-
-    @property
-    def row(self):
-        """Row of the widget in the grid."""
-        return self._row
-
-    @row.setter
-    def row(self, value: int):
-        if value < 0:
-            raise ValueError("Row must be a non-negative integer")
-        self._row = value
-
-    @property
-    def rowspan(self):
-        """Row span of the widget in the grid."""
-        return self._rowspan
-
-    @rowspan.setter
-    def rowspan(self, value: int):
-        if value < 1:
-            raise ValueError("Row span must be a positive integer")
-        self._rowspan = value
-
-    @property
-    def ipadx(self):
-        """Internal padding in x direction."""
-        return self._ipadx
-
-    @ipadx.setter
-    def ipadx(self, value: int):
-        if value < 0:
-            raise ValueError("Internal padding in x direction must be a non-negative integer")
-        self._ipadx = value
-
-    @property
-    def ipady(self):
-        """Internal padding in y direction."""
-        return self._ipady
-
-    @ipady.setter
-    def ipady(self, value: int):
-        if value < 0:
-            raise ValueError("Internal padding in y direction must be a non-negative integer")
-        self._ipady = value
-
-    @property
-    def padx(self):
-        """External padding in x direction."""
-        return self._padx
-
-    @padx.setter
-    def padx(self, value: int):
-        if value < 0:
-            raise ValueError("Padding in x direction must be a non-negative integer")
-        self._padx = value
-
-    @property
-    def pady(self):
-        """External padding in y direction."""
-        return self._pady
-
-    @pady.setter
-    def pady(self, value: int):
-        if value < 0:
-            raise ValueError("Padding in y direction must be a non-negative integer")
-        self._pady = value
+    column = _Option("Column of the widget in the grid.")
+    columnspan = _Option("Column span of the widget in the grid.")
+    row = _Option("Row of the widget in the grid.")
+    rowspan = _Option("Row span of the widget in the grid.")
+    ipadx = _Option("Internal padding in x direction.")
+    ipady = _Option("Internal padding in y direction.")
+    padx = _Option("External padding in x direction.")
+    pady = _Option("External padding in y direction.")
 
     # endregion Properties
 
@@ -419,6 +416,7 @@ class Grid:
             raise ValueError("Rows and columns must be positive integers")
         cls.num_rows = rows
         cls.num_columns = columns
+        Grid._cell_cache.clear()
 
     @classmethod
     def get_grid_size(cls):
@@ -434,6 +432,7 @@ class Grid:
         """Reset the grid size to the default of 3 rows and 3 columns."""
         cls.num_rows = 3
         cls.num_columns = 3
+        Grid._cell_cache.clear()
 
     # endregion Classmethod
 
@@ -478,34 +477,45 @@ class Grid:
         self._padx = padx
         self._pady = pady
 
-        master = getattr(self, "_master", None)
-        rect = getattr(self, "_rect", None)
+        master = self._master
+        rect = self._rect
         if master is None or rect is None:
             return
 
-        cell_width = master.get_width() // Grid.num_columns
-        cell_height = master.get_height() // Grid.num_rows
+        size = master.get_size()
+        rows, columns = Grid.num_rows, Grid.num_columns
 
-        rect.x = self._column * cell_width
-        rect.y = self._row * cell_height
-        rect.width = cell_width * self._columnspan
-        rect.height = cell_height * self._rowspan
-
-        # Internal and external padding
-        rect.width += 2 * (self._ipadx or 0)
-        rect.height += 2 * (self._ipady or 0)
-        rect.width += 2 * (self._padx if isinstance(self._padx, (int, float)) else sum(self._padx))
-        rect.height += 2 * (self._pady if isinstance(self._pady, (int, float)) else sum(self._pady))
-
-        # Sticky (align inside cell)
-        if self._sticky == "n":
-            rect.y = self._row * cell_height
-        elif self._sticky == "s":
+        # Re-applying the same options to the rect this call produced last time
+        # is a no-op, so skip the layout (and the repaint it would trigger)
+        key = ("grid", size, rows, columns, row, column, rowspan, columnspan)
+        key += (ipadx, ipady, sticky, padx, pady)
+        if self._layout_key == (key, tuple(rect)):
+            return
+        self._dirty = True
+
+        cell_key = (size, rows, columns)
+        cell = Grid._cell_cache.get(cell_key)
+        if cell is None:
+            cell = Grid._cell_cache[cell_key] = (size[0] // columns, size[1] // rows)
+        cell_width, cell_height = cell
+
+        # Cell area grown by the internal and external padding
+        padx = (self._ipadx or 0) + (self._padx if isinstance(self._padx, (int, float)) else sum(self._padx))
+        pady = (self._ipady or 0) + (self._pady if isinstance(self._pady, (int, float)) else sum(self._pady))
+        rect.update(
+            self._column * cell_width,
+            self._row * cell_height,
+            cell_width * self._columnspan + 2 * padx,
+            cell_height * self._rowspan + 2 * pady,
+        )
+
+        # Sticky (align inside cell); "n" and "w" keep the cell's top-left set above
+        if sticky == "s":
             rect.y = (self._row + 1) * cell_height - rect.height
-        elif self._sticky == "e":
+        elif sticky == "e":
             rect.x = (self._column + 1) * cell_width - rect.width
-        elif self._sticky == "w":
-            rect.x = self._column * cell_width
+
+        self._layout_key = (key, tuple(rect))
 
     def grid_info(self):
         """Return a dictionary of the current grid options for this widget."""
@@ -543,6 +553,13 @@ class Place:
         _bordermode (str): Border mode ('inside' or 'outside').
     """
 
+    # Storage is declared by the widget class that combines the managers
+    __slots__ = ()
+
+    # Fallbacks for classes that never set these, so layout can read them directly
+    _master = None
+    _rect = None
+
     def __init__(self):
         """Initialize place options to None."""
         self._x: ScreenUnits = 0
@@ -553,90 +570,19 @@ class Place:
         self._relwidth: int | float = 0
         self._relheight: int | float = 0
         self._bordermode: Literal["inside", "outside", "ignore"] = None
+        self._layout_key: tuple | None = None  # (inputs, resulting rect) of the last layout
+        super().__init__()
 
     # region Properties
 
-    @property
-    def x(self):
-        """Absolute x position of the widget."""
-        return self._x
-
-    @x.setter
-    def x(self, value: int):
-        self._x = value
-
-    @property
-    def y(self):
-        """Absolute y position of the widget."""
-        return self._y
-
-    @y.setter
-    def y(self, value: int):
-        self._y = value
-
-    @property
-    def relx(self):
-        """Relative x position of the widget (0.0 to 1.0)."""
-        return self._relx
-
-    @relx.setter
-    def relx(self, value: float):
-        if not (0.0 <= value <= 1.0):
-            raise ValueError("relx must be between 0.0 and 1.0")
-        self._relx = value
-
-    @property
-    def rely(self):
-        """Relative y position of the widget (0.0 to 1.0)."""
-        return self._rely
-
-    @rely.setter
-    def rely(self, value: float):
-        if not (0.0 <= value <= 1.0):
-            raise ValueError("rely must be between 0.0 and 1.0")
-        self._rely = value
-
-    @property
-    def anchor(self):
-        """Anchor position of the widget."""
-        return self._anchor
-
-    @anchor.setter
-    def anchor(self, value: str):
-        self._anchor = value
-
-    @property
-    def relwidth(self):
-        """Relative width of the widget (0.0 to 1.0)."""
-        return self._relwidth
-
-    @relwidth.setter
-    def relwidth(self, value: float):
-        if not (0.0 <= value <= 1.0):
-            raise ValueError("relwidth must be between 0.0 and 1.0")
-        self._relwidth = value
-
-    @property
-    def relheight(self):
-        """Relative height of the widget (0.0 to 1.0)."""
-        return self._relheight
-
-    @relheight.setter
-    def relheight(self, value: float):
-        if not (0.0 <= value <= 1.0):
-            raise ValueError("relheight must be between 0.0 and 1.0")
-        self._relheight = value
-
-    @property
-    def bordermode(self):
-        """Border mode of the widget ('inside' or 'outside')."""
-        return self._bordermode
-
-    @bordermode.setter
-    def bordermode(self, value: str):
-        if value not in ("inside", "outside"):
-            raise ValueError("bordermode must be 'inside' or 'outside'")
-        self._bordermode = value
+    x = _Option("Absolute x position of the widget.")
+    y = _Option("Absolute y position of the widget.")
+    relx = _Option("Relative x position of the widget (0.0 to 1.0).")
+    rely = _Option("Relative y position of the widget (0.0 to 1.0).")
+    anchor = _Option("Anchor position of the widget.", validate=False)
+    relwidth = _Option("Relative width of the widget (0.0 to 1.0).")
+    relheight = _Option("Relative height of the widget (0.0 to 1.0).")
+    bordermode = _Option("Border mode of the widget ('inside' or 'outside').")
 
     # endregion Properties
 
@@ -682,44 +628,36 @@ class Place:
         self._relheight = relheight
         self._bordermode = bordermode
 
-        master = getattr(self, "_master", None)
-        rect = getattr(self, "_rect", None)
+        master = self._master
+        rect = self._rect
         if master is None or rect is None:
             return
 
-        # Calculate absolute position
-        rect.x = int(x + (master.get_width() * relx))
-        rect.y = int(y + (master.get_height() * rely))
-
-        # Set width/height
-        if width is not None:
-            rect.width = width
-        elif relwidth:
-            rect.width = int(master.get_width() * relwidth)
-        if height is not None:
-            rect.height = height
-        elif relheight:
-            rect.height = int(master.get_height() * relheight)
-
-        # Anchor adjustment
-        if anchor == "center":
-            rect.center = (rect.x, rect.y)
-        elif anchor == "n":
-            rect.midtop = (rect.x, rect.y)
-        elif anchor == "s":
-            rect.midbottom = (rect.x, rect.y)
-        elif anchor == "e":
-            rect.midright = (rect.x, rect.y)
-        elif anchor == "w":
-            rect.midleft = (rect.x, rect.y)
-        elif anchor == "ne":
-            rect.topright = (rect.x, rect.y)
-        elif anchor == "nw":
-            rect.topleft = (rect.x, rect.y)
-        elif anchor == "se":
-            rect.bottomright = (rect.x, rect.y)
-        elif anchor == "sw":
-            rect.bottomleft = (rect.x, rect.y)
+        # Query the master size once for the relative terms below
+        mw, mh = master.get_size()
+
+        # Re-applying the same options to the rect this call produced last time
+        # is a no-op, so skip the layout (and the repaint it would trigger)
+        key = ("place", mw, mh, x, y, anchor, relx, rely, relwidth, relheight, width, height)
+        if self._layout_key == (key, tuple(rect)):
+            return
+        self._dirty = True
+
+        # Absolute position and size in one update; Rect truncates floats the
+        # way int() would, and zero relative terms skip their multiply
+        rect.update(
+            x + mw * relx if relx else x,
+            y + mh * rely if rely else y,
+            width if width is not None else (mw * relwidth if relwidth else rect.width),
+            height if height is not None else (mh * relheight if relheight else rect.height),
+        )
+
+        # Anchor adjustment: the placed point becomes the given anchor of the rect
+        point = _ANCHOR_POINTS.get(anchor)
+        if point is not None:
+            setattr(rect, point, rect.topleft)
+
+        self._layout_key = (key, tuple(rect))
 
     def place_info(self):
         """Return a dictionary of the current placing options for this widget."""
@@ -1,7 +1,5 @@
 from uinex.theme.manager import ThemeManager
 
-# load default blue theme
-try:
-    ThemeManager.load_theme("blue")
-except FileNotFoundError as err:
-    raise FileNotFoundError(f"{err}\n The theme file could not be found.\n") from err
+# The default blue theme is loaded on first access to ThemeManager.theme
+
+__all__ = ["ThemeManager"]
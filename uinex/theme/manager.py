@@ -1,8 +1,10 @@
 import copy
+import functools
 import json
-import os
 import pathlib
 
+import pygame
+
 from uinex.core.exceptions import ThemeError
 
 # Sensible defaults used when no theme file has been loaded explicitly.
@@ -131,10 +133,67 @@ _DEFAULT_THEME: dict = {
 }
 
 
-class ThemeManager:
-    theme: dict = copy.deepcopy(_DEFAULT_THEME)  # pre-populated with defaults
+@functools.lru_cache(maxsize=256)
+def _parse_color(value: str) -> tuple[int, int, int, int]:
+    """Parse a color string (``"#RRGGBB"``, ``"#RRGGBBAA"`` or a name) to an RGBA tuple."""
+    return tuple(pygame.Color(value))
+
+
+def _flatten_theme(node: dict, prefix: tuple, flat: dict) -> dict:
+    """Add every path under *node* to *flat* and return *node* with colors parsed.
+
+    Sections are stored as copies whose hex color strings are already RGBA
+    tuples, so a looked-up section can be read without parsing.
+    """
+    parsed = {}
+    for key, value in node.items():
+        path = (*prefix, key)
+        if isinstance(value, dict):
+            value = _flatten_theme(value, path, flat)
+        elif isinstance(value, str) and value.startswith("#"):
+            try:
+                value = _parse_color(value)
+            except ValueError:
+                pass
+        flat[path] = parsed[key] = value
+    return parsed
+
+
+# Directory holding the built-in ``<name>.json`` theme files
+_THEMES_DIR = pathlib.Path(__file__).resolve().parent.parent / "assets" / "themes"
+
+
+# Built-in theme applied when ``ThemeManager.theme`` is first read without one set
+_DEFAULT_THEME_NAME = "blue"
+
+
+class _ThemeManagerMeta(type):
+    """Loads the default theme on first access to ``ThemeManager.theme``.
+
+    Importing the package then does no file I/O; the theme file is read by the
+    first widget (or caller) that needs it.
+    """
+
+    @property
+    def theme(cls) -> dict:
+        if cls._theme is None:
+            cls.load_theme(_DEFAULT_THEME_NAME)
+        return cls._theme
+
+    @theme.setter
+    def theme(cls, value: dict) -> None:
+        cls._theme = value
+        cls._flat = None
+
+
+class ThemeManager(metaclass=_ThemeManagerMeta):
+    _theme: dict | None = None  # active theme; see ``_ThemeManagerMeta.theme``
+    _flat: dict[tuple, object] | None = None  # path -> value view of ``theme``; see ``lookup``
     _built_in_themes: list[str] = ["blue"]
     _currently_loaded_theme: str | None = None
+    # Built-in theme name -> merged theme; files shipped with the package never
+    # change, so each is read and merged once and copied on later loads
+    _theme_cache: dict[str, dict] = {}
 
     @staticmethod
     def _deep_merge(base: dict, updates: dict) -> dict:
@@ -147,6 +206,45 @@ class ThemeManager:
                 merged[key] = value
         return merged
 
+    @staticmethod
+    def color(value, default=None):
+        """Return *value* as a color drawing calls accept without re-parsing it.
+
+        Color strings are parsed to an RGBA tuple once and cached, so per-frame
+        lookups of theme colors do not build a new ``pygame.Color``. Other
+        values (tuples, ``pygame.Color``) are returned unchanged.
+
+        Args:
+            value: Color string, RGB(A) sequence or ``pygame.Color``.
+            default: Returned in place of a ``None`` value.
+        """
+        if value is None:
+            value = default
+        if isinstance(value, str):
+            return _parse_color(value)
+        return value
+
+    @classmethod
+    def lookup(cls, *path: str, default=None):
+        """Return the theme value at *path* with one tuple-keyed dict probe.
+
+        ``lookup("Entry", "focused")`` reads ``theme["Entry"]["focused"]``, with
+        hex colors already parsed to RGBA tuples (sections are returned as
+        parsed copies; treat them as read-only). The table is rebuilt after the
+        theme is replaced, so change themes through ``load_theme`` or
+        ``update_theme`` rather than editing ``theme`` in place.
+
+        Args:
+            *path: Keys from the theme root down to the wanted value.
+            default: Returned when the path is not in the theme.
+        """
+        flat = cls._flat
+        if flat is None:
+            flat = {}
+            _flatten_theme(cls.theme, (), flat)
+            cls._flat = flat
+        return flat.get(path, default)
+
     @classmethod
     def get_default_theme(cls) -> dict:
         """Return a deep copy of the internal default theme."""
@@ -187,17 +285,16 @@ class ThemeManager:
         Raises:
             ThemeError: If the theme file cannot be found or parsed.
         """
-        script_directory = os.path.dirname(os.path.abspath(__file__))
+        built_in = theme_name_or_path in cls._built_in_themes
+        if built_in and theme_name_or_path in cls._theme_cache:
+            cls.theme = copy.deepcopy(cls._theme_cache[theme_name_or_path])
+            cls._currently_loaded_theme = theme_name_or_path
+            return
 
+        theme_path = _THEMES_DIR / f"{theme_name_or_path}.json" if built_in else theme_name_or_path
         try:
-            if theme_name_or_path in cls._built_in_themes:
-                uinex_path = pathlib.Path(script_directory).parent
-                theme_path = os.path.join(uinex_path, "assets", "themes", f"{theme_name_or_path}.json")
-                with open(theme_path) as f:
-                    loaded = json.load(f)
-            else:
-                with open(theme_name_or_path) as f:
-                    loaded = json.load(f)
+            with open(theme_path) as f:
+                loaded = json.load(f)
         except FileNotFoundError as exc:
             raise ThemeError(f"Theme file not found: {theme_name_or_path!r}") from exc
         except json.JSONDecodeError as exc:
@@ -205,6 +302,8 @@ class ThemeManager:
 
         # Deep merge: start fresh from defaults then apply file values
         merged = cls._deep_merge(_DEFAULT_THEME, loaded)
+        if built_in:
+            cls._theme_cache[theme_name_or_path] = copy.deepcopy(merged)
         cls.theme = merged
 
         # store theme path for saving
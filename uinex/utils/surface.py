@@ -0,0 +1,93 @@
+"""Uinex Surface Helpers
+
+Small helpers around ``pygame.Surface`` shared by widgets and managers.
+
+Author: Sackey Ezekiel Etrue (https://github.com/djoezeke) & Uinex Contributors
+License: MIT
+"""
+
+from collections.abc import Sequence
+
+import pygame
+
+__all__ = ["acquire_surface", "blit_batch", "convert_surface", "release_surface"]
+
+# ``Surface.fblits`` only exists on pygame-ce; plain pygame falls back to ``blits``.
+_HAS_FBLITS: bool = hasattr(pygame.Surface, "fblits")
+
+# Released surfaces kept for reuse, keyed by (size, flags)
+_SURFACE_POOL: dict[tuple[tuple[int, int], int], list[pygame.Surface]] = {}
+_POOL_SIZE_LIMIT = 4  # surfaces kept per key
+_POOL_KEY_LIMIT = 32  # distinct keys before the pool is reset
+
+
+def blit_batch(
+    target: pygame.Surface,
+    sequence: Sequence[tuple[pygame.Surface, pygame.Rect | tuple[int, int]]],
+    special_flags: int = 0,
+) -> None:
+    """Blit a sequence of ``(source, dest)`` pairs onto *target* in one call.
+
+    Args:
+        target: The surface to draw on.
+        sequence: ``(source, dest)`` pairs, drawn in order.
+        special_flags: Blend flag applied to every pair.
+    """
+    if not sequence:
+        return
+    if _HAS_FBLITS:
+        target.fblits(sequence, special_flags)
+    elif special_flags:
+        target.blits([(source, dest, None, special_flags) for source, dest in sequence], doreturn=False)
+    else:
+        target.blits(sequence, doreturn=False)
+
+
+def convert_surface(surface: pygame.Surface) -> pygame.Surface:
+    """Return *surface* converted to the display pixel format.
+
+    Format-matched surfaces take pygame's fast blit paths instead of converting
+    pixels on every blit. Per-pixel alpha is kept. Before a display mode is set
+    the surface is returned unchanged.
+
+    Args:
+        surface: The surface to convert.
+    """
+    if not pygame.display.get_init() or pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def acquire_surface(size: tuple[int, int], flags: int = pygame.SRCALPHA) -> pygame.Surface:
+    """Return a cleared surface of *size*, reusing a released one when possible.
+
+    New surfaces are converted to the display pixel format when a display exists.
+
+    Args:
+        size: ``(width, height)`` of the surface.
+        flags: Surface flags, ``SRCALPHA`` by default.
+    """
+    pooled = _SURFACE_POOL.get((tuple(size), flags))
+    if pooled:
+        surface = pooled.pop()
+        surface.fill((0, 0, 0, 0))
+        return surface
+    return convert_surface(pygame.Surface(size, flags, 32))
+
+
+def release_surface(surface: pygame.Surface) -> None:
+    """Hand a surface that is no longer drawn back for reuse by :func:`acquire_surface`.
+
+    Args:
+        surface: The surface to release; the caller must not use it afterwards.
+    """
+    key = (surface.get_size(), surface.get_flags() & pygame.SRCALPHA)
+    pooled = _SURFACE_POOL.get(key)
+    if pooled is None:
+        if len(_SURFACE_POOL) >= _POOL_KEY_LIMIT:
+            _SURFACE_POOL.clear()
+        pooled = _SURFACE_POOL[key] = []
+    if len(pooled) < _POOL_SIZE_LIMIT:
+        pooled.append(surface)
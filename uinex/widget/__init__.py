@@ -1,23 +1,46 @@
-"""Uinex Widgets"""
-
-from uinex.widget.boxes import ComboBox
-from uinex.widget.boxes import ListBox
-from uinex.widget.boxes import SpinBox
-from uinex.widget.boxes import TextBox
-from uinex.widget.buttons import Button
-from uinex.widget.buttons import CheckButton
-from uinex.widget.buttons import MenuButton
-from uinex.widget.buttons import RadioButton
-from uinex.widget.dialog import Dialog
-from uinex.widget.frame import Frame
-from uinex.widget.inputs import Entry
-from uinex.widget.label import Label
-from uinex.widget.manager import WidgetManager
-from uinex.widget.progress import Floodgauge
-from uinex.widget.progress import Meter
-from uinex.widget.progress import Progressbar
-from uinex.widget.scale import Scale
-from uinex.widget.separator import Separator
-from uinex.widget.sizegrip import SizeGrip
-from uinex.widget.tooltip import Tooltip
-from uinex.widget.treeview import TreeView
+"""Uinex Widgets
+
+Widget classes are imported on first access, so importing one widget does not
+load every widget module.
+"""
+
+import importlib
+
+_LAZY_WIDGETS: dict[str, str] = {
+    "ComboBox": "uinex.widget.boxes",
+    "ListBox": "uinex.widget.boxes",
+    "SpinBox": "uinex.widget.boxes",
+    "TextBox": "uinex.widget.boxes",
+    "Button": "uinex.widget.buttons",
+    "CheckButton": "uinex.widget.buttons",
+    "MenuButton": "uinex.widget.buttons",
+    "RadioButton": "uinex.widget.buttons",
+    "Dialog": "uinex.widget.dialog",
+    "Frame": "uinex.widget.frame",
+    "Entry": "uinex.widget.inputs",
+    "Label": "uinex.widget.label",
+    "WidgetManager": "uinex.widget.manager",
+    "Floodgauge": "uinex.widget.progress",
+    "Meter": "uinex.widget.progress",
+    "Progressbar": "uinex.widget.progress",
+    "Scale": "uinex.widget.scale",
+    "Separator": "uinex.widget.separator",
+    "SizeGrip": "uinex.widget.sizegrip",
+    "Tooltip": "uinex.widget.tooltip",
+    "TreeView": "uinex.widget.treeview",
+}
+
+__all__ = list(_LAZY_WIDGETS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_WIDGETS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_WIDGETS))
@@ -16,10 +16,13 @@ License: MIT
 
 import copy
 import time
-from abc import abstractmethod
+import weakref
 from collections.abc import Callable
+from collections.abc import Iterable
+from enum import Enum
 from inspect import signature
 from typing import Any
+from typing import ClassVar
 from typing import Union
 
 import pygame
@@ -28,11 +31,102 @@ from pygame.event import Event
 
 # from uinex.core.exceptions import PygameuiError
 from uinex.core.geometry import Grid
+from uinex.core.geometry import LAYOUT_OPTIONS
 from uinex.core.geometry import Pack
 from uinex.core.geometry import Place
+from uinex.core.geometry import set_layout_options
 from uinex.theme.manager import ThemeManager
+from uinex.utils.surface import blit_batch
+from uinex.utils.surface import convert_surface
 
-__all__ = ["Widget"]
+__all__ = ["Widget", "WidgetState"]
+
+
+class WidgetState(str, Enum):
+    """Interaction states of a widget.
+
+    Members compare equal to their string values, so ``widget.state == "normal"``
+    keeps working; internally states are compared by identity.
+    """
+
+    NORMAL = "normal"
+    HOVERED = "hovered"
+    CLICKED = "clicked"
+    DISABLED = "disabled"
+
+
+# Rendered strings kept per widget before the text cache is reset
+_TEXT_CACHE_SIZE = 32
+
+# Focused-widget callbacks looked up by event type instead of an if/elif chain
+_FOCUS_HANDLERS: dict[int, str] = {
+    pygame.KEYDOWN: "on_keydown",
+    pygame.KEYUP: "on_keyup",
+}
+
+# Event types produced by each input device, keyed by the flag enabling it
+_DEVICE_EVENTS: dict[str, frozenset[int]] = {
+    "_mouse_enabled": frozenset({pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL}),
+    "_keyboard_enabled": frozenset({pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT}),
+    "_joystick_enabled": frozenset(
+        {
+            pygame.JOYAXISMOTION,
+            pygame.JOYBALLMOTION,
+            pygame.JOYHATMOTION,
+            pygame.JOYBUTTONDOWN,
+            pygame.JOYBUTTONUP,
+        }
+    ),
+    "_touchscreen_enabled": frozenset({pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION}),
+}
+
+
+# region Master resolution
+
+
+def _master_from_rect(master: pygame.Rect, child: "Widget") -> tuple[Surface | None, pygame.Rect]:
+    return None, master
+
+
+def _master_from_surface(master: Surface, child: "Widget") -> tuple[Surface, pygame.Rect]:
+    return master, master.get_rect()
+
+
+def _master_from_widget(master: "Widget", child: "Widget") -> tuple[Surface, pygame.Rect]:
+    master._adopt_(child)
+    return master._surface, master._rect
+
+
+def _master_from_other(master: Any, child: "Widget") -> tuple[None, None]:
+    return None, None
+
+
+# ``type(master)`` -> resolver returning ``(master surface, master rect)``; other
+# types are classified with ``isinstance`` once and then cached here.
+_MASTER_RESOLVERS: dict[type, Callable[[Any, "Widget"], tuple]] = {
+    pygame.Rect: _master_from_rect,
+    pygame.Surface: _master_from_surface,
+    type(None): _master_from_other,
+}
+
+
+def _master_resolver(master: Any) -> Callable[[Any, "Widget"], tuple]:
+    """Return the resolver for *master*'s type, classifying new types once."""
+    resolve = _MASTER_RESOLVERS.get(type(master))
+    if resolve is None:
+        if isinstance(master, pygame.Rect):
+            resolve = _master_from_rect
+        elif isinstance(master, pygame.Surface):
+            resolve = _master_from_surface
+        elif isinstance(master, Widget):
+            resolve = _master_from_widget
+        else:
+            resolve = _master_from_other
+        _MASTER_RESOLVERS[type(master)] = resolve
+    return resolve
+
+
+# endregion
 
 
 class Widget(Place, Grid, Pack):
@@ -58,6 +152,135 @@ class Widget(Place, Grid, Pack):
         widget.draw(surface=screen)
     """
 
+    # Fixed per-widget storage, including the Pack/Grid/Place options (those
+    # classes declare empty slots). Subclasses without ``__slots__`` still get
+    # a ``__dict__`` for their own attributes.
+    __slots__ = (
+        "__weakref__",
+        # Widget
+        "_after_queue",
+        "_angle",
+        "_base_theme",
+        "_blendmode",
+        "_blocked_events",
+        "_border_position",
+        "_border_radius",
+        "_bordermode",
+        "_borderwidth",
+        "_commands",
+        "_converted",
+        "_cursor",
+        "_dirty",
+        "_disabled",
+        "_drawn_rect",
+        "_flipx",
+        "_flipy",
+        "_focused",
+        "_handler",
+        "_height",
+        "_inset_rect",
+        "_joystick_enabled",
+        "_keyboard_enabled",
+        "_master",
+        "_master_rect",
+        "_mouse_enabled",
+        "_rect",
+        "_shadow",
+        "_shadow_width",
+        "_shadowcolor",
+        "_shadowoffset",
+        "_show_tooltip",
+        "_state",
+        "_surface",
+        "_text_cache",
+        "_theme",
+        "_theme_source",
+        "_tooltip",
+        "_tooltip_delay",
+        "_tooltip_rect",
+        "_tooltip_timer",
+        "_touchscreen_enabled",
+        "_visible",
+        "_width",
+        "blit_data",
+        "parent",
+        # Pack / Grid / Place
+        "_anchor",
+        "_column",
+        "_columnspan",
+        "_expand",
+        "_fill",
+        "_ipadx",
+        "_ipady",
+        "_layout_key",
+        "_padx",
+        "_pady",
+        "_relheight",
+        "_relwidth",
+        "_relx",
+        "_rely",
+        "_row",
+        "_rowspan",
+        "_side",
+        "_sticky",
+        "_x",
+        "_y",
+    )
+
+    # Live widget instances, so theme reloads can invalidate them
+    _instances: ClassVar[weakref.WeakSet["Widget"]] = weakref.WeakSet()
+
+    # Only the bare base class draws the placeholder rect on its master; resolved
+    # once per class in ``__init_subclass__`` instead of comparing names per draw.
+    _is_bare_widget: bool = True
+
+    # Composited widgets keep their whole appearance in ``_surface`` (see
+    # ``_recompose_``), so managers can blit them in one batched call.
+    _composited: bool = False
+
+    # Opaque color a widget's whole area is painted with, or None. Managers fill
+    # such widgets straight into the target surface instead of blitting ``_surface``.
+    _solid_color: pygame.Color | None = None
+
+    # ``configure(key)`` reads answered by a plain attribute, looked up in one dict probe.
+    # Subclasses extend this with ``{**Parent._config_attrs, ...}``.
+    _config_attrs: ClassVar[dict[str, str]] = {
+        "surface": "_surface",
+        "rect": "_rect",
+        "master": "_master",
+        "master_rect": "_master_rect",
+        "height": "_height",
+        "width": "_width",
+        "cursor": "_cursor",
+        "theme": "_theme",
+        "state": "_state",
+        "disabled": "_disabled",
+        "focused": "_focused",
+        "visible": "_visible",
+        "dirty": "_dirty",
+        "shadow": "_shadow",
+        "shadow_width": "_shadow_width",
+        "shadowoffset": "_shadowoffset",
+        "shadowcolor": "_shadowcolor",
+        "angle": "_angle",
+        "flipx": "_flipx",
+        "flipy": "_flipy",
+        "tooltip": "_tooltip",
+        "show_tooltip": "_show_tooltip",
+        "tooltip_delay": "_tooltip_delay",
+        "tooltip_timer": "_tooltip_timer",
+        "border_radius": "_border_radius",
+        "borderwidth": "_borderwidth",
+        "bordermode": "_bordermode",
+        "border_position": "_border_position",
+        **{name: "_" + name for name in LAYOUT_OPTIONS},
+    }
+
+    # Event types managers route to ``handle()``; ``None`` (the default) routes every
+    # event not blocked by a disabled input device. Subclasses that only react to a
+    # few types may narrow this; types bound with ``bind()`` are routed in addition.
+    _handled_events: frozenset[int] | None = None
+
     def __init__(
         self,
         master: Union["Widget", pygame.Surface] | None = None,
@@ -77,36 +300,43 @@ class Widget(Place, Grid, Pack):
             **kwargs: Additional configuration options.
         """
         pygame.font.init()
+        Widget._instances.add(self)
         self._cursor: pygame.Cursor = kwargs.pop("cursor", None)
 
-        # Default theme – start with class-level defaults then overlay theme file values
+        # Default theme – start with class-level defaults then overlay theme file values.
+        # The looked-up section has its hex colors parsed once per theme, not per widget.
         self._theme: dict = {}
-        self._theme.update(ThemeManager.theme.get(self.__class__.__name__, {}))
+        self._theme_source: dict = ThemeManager.lookup(self.__class__.__name__, default={})
+        self._update_theme_(self._theme_source)
 
         # Allow per-instance theme overrides via the ``theme`` kwarg
         _instance_theme = kwargs.pop("theme", None)
         if isinstance(_instance_theme, dict):
-            self._theme.update(_instance_theme)
+            self._update_theme_(_instance_theme)
         self._base_theme: dict = copy.deepcopy(self._theme)
 
         # Command/event handler registry
         self._handler: dict[int, Callable] = {}
         self._commands: dict[str, Callable] = {}
+        self.parent = None  # Manager this widget is registered with
 
         # Inputs Events
         self._keyboard_enabled = True  # Enable/Accept Keyboard interaction
         self._joystick_enabled = False  # Enable/Accept Joystick interaction
         self._touchscreen_enabled = False  # Enable/Accept Touch interaction
         self._mouse_enabled = True  # Enable/Accept Mouse interaction
+        self._rebuild_event_filter_()
 
         # State, interactivity and Visibility
-        self._state: str = "normal"  # Use set_state() to modify this status
+        self._state: WidgetState = WidgetState.NORMAL  # Use set_state() to modify this status
         self._disabled: bool = False  # Use enable() or disable() to modify this status
         self._focused: bool = False  # Use focus() or unfocus() to modify this status
         self._visible: bool = True  # Use show() or hide() to modify this status
 
         # Set if widget need to be redrawn or not
         self._dirty: bool = True  # Use dirty property to modify this status
+        self._drawn_rect: pygame.Rect | None = None  # Screen area covered by the last presented draw
+        self._tooltip_rect: pygame.Rect | None = None
 
         # Widget Attributes
         self._height: int = height
@@ -136,9 +366,7 @@ class Widget(Place, Grid, Pack):
         self._shadow: bool = kwargs.pop("shadow", False)
         self._shadow_width: int = kwargs.pop("shadow_width", 0)
         self._shadowoffset: tuple[int, int] = kwargs.pop("shadowoffset", (5, 5))
-        self._shadowcolor: pygame.Color = kwargs.pop("shadowcolor", (0, 0, 0))
-        if isinstance(self._shadowcolor, str):
-            self._shadowcolor = pygame.Color(self._shadowcolor)
+        self._shadowcolor: pygame.Color = self._normalize_color_(kwargs.pop("shadowcolor", (0, 0, 0)))
 
         # Widget transforms
         self._angle: int = kwargs.pop("angle", 0)  # Rotation angle (degrees)
@@ -146,18 +374,7 @@ class Widget(Place, Grid, Pack):
         self._flipy: bool = kwargs.pop("flipy", False)
 
         # Master Surface and Rect
-        if isinstance(master, pygame.Rect):
-            self._master: pygame.Surface = None
-            self._master_rect: pygame.Rect = master
-        elif isinstance(master, pygame.Surface):
-            self._master: pygame.Surface = master
-            self._master_rect: pygame.Rect = master.get_rect()
-        elif isinstance(master, Widget):
-            self._master: pygame.Surface = master._surface
-            self._master_rect: pygame.Rect = master._rect
-        else:
-            self._master: pygame.Surface = None
-            self._master_rect: pygame.Rect = None
+        self._master, self._master_rect = _master_resolver(master)(master, self)
 
         # Widget Tooltip
         self._tooltip: str = self._kwarg_get(kwargs, "tooltip", "")
@@ -166,24 +383,29 @@ class Widget(Place, Grid, Pack):
         self._tooltip_timer: float = 0.0
 
         # Surface and rect setup
+        self._converted: bool = False  # Set once _surface matches the display pixel format
         self._surface = pygame.Surface((width, height), pygame.SRCALPHA, 32)  # Surface of the widget
         self._rect: pygame.Rect = self._surface.get_rect(topleft=(0, 0))  # To position the widget
+        self._inset_rect: pygame.Rect = self._rect.inflate(-20, -20)  # Reused by the bare-widget draw
 
         # Blending and Blitting Data
-        self._blendmode: int = pygame.BLEND_RGBA_ADD
-        self.blit_data: tuple | list = [
-            self._surface,
-            self._rect,
-            None,
-            self._blendmode,
-        ]
+        self._blendmode: int = 0  # special_flags used when blitting the widget's own surface
+        # (surface, dest) pair handed to batched blits; see ``_rebuild_blit_data_``.
+        # The blend mode is passed once per batch instead of per entry.
+        self.blit_data: tuple[Surface, pygame.Rect]
+        self._rebuild_blit_data_()
+        self._convert_surfaces_()
 
-        # Initialize geometry managers
-        Place.__init__(self)
-        Grid.__init__(self)
-        Pack.__init__(self)
+        # Initialize geometry managers (Place -> Grid -> Pack, chained cooperatively)
+        super().__init__()
 
-        self._after_queue = []  # List of (run_at, callable, args, kwargs)
+        self._after_queue: tuple = ()  # (run_at, callback) pairs; replaced, never mutated
+        self._text_cache: dict[tuple, pygame.Surface] = {}  # Rendered text keyed by (font, text, color, antialias)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Mark subclasses as real widgets, which draw themselves."""
+        super().__init_subclass__(**kwargs)
+        cls._is_bare_widget = False
 
     def __getitem__(self, config: str) -> Any:
         """Get an item from the widget's configuration."""
@@ -221,15 +443,16 @@ class Widget(Place, Grid, Pack):
     # region Properties
 
     @property
-    def state(self) -> str:
+    def state(self) -> WidgetState:
         """Get or Set the current state of the widget."""
         return self._state
 
     @state.setter
-    def state(self, value: str):
-        if len(value) < 6:
-            raise ValueError(f"Unknown State {value}")
-        self._state = value
+    def state(self, value: WidgetState | str):
+        try:
+            self._state = WidgetState(value)
+        except ValueError:
+            raise ValueError(f"Unknown State {value}") from None
 
     @property
     def focused(self) -> bool:
@@ -257,6 +480,7 @@ class Widget(Place, Grid, Pack):
     @keyboard.setter
     def keyboard(self, value: bool):
         self._keyboard_enabled = value
+        self._rebuild_event_filter_()
 
     @property
     def mouse(self) -> bool:
@@ -266,6 +490,7 @@ class Widget(Place, Grid, Pack):
     @mouse.setter
     def mouse(self, value: bool):
         self._mouse_enabled = value
+        self._rebuild_event_filter_()
 
     @property
     def joystick(self) -> bool:
@@ -275,6 +500,7 @@ class Widget(Place, Grid, Pack):
     @joystick.setter
     def joystick(self, value: bool):
         self._joystick_enabled = value
+        self._rebuild_event_filter_()
 
     @property
     def touchscreen(self) -> bool:
@@ -284,6 +510,7 @@ class Widget(Place, Grid, Pack):
     @touchscreen.setter
     def touchscreen(self, value: bool):
         self._touchscreen_enabled = value
+        self._rebuild_event_filter_()
 
     @property
     def width(self) -> int:
@@ -310,7 +537,7 @@ class Widget(Place, Grid, Pack):
     @property
     def visible(self) -> bool:
         """Get or set the widget's visibility."""
-        return self._get_visible_()
+        return self._visible
 
     @visible.setter
     def visible(self, value) -> None:
@@ -324,7 +551,7 @@ class Widget(Place, Grid, Pack):
     @surface.setter
     def surface(self, value: Surface) -> None:
         self._surface = value
-        self.blit_data[0] = self._surface
+        self._rebuild_blit_data_()
 
     @property
     def rect(self) -> pygame.Rect:
@@ -334,7 +561,8 @@ class Widget(Place, Grid, Pack):
     @rect.setter
     def rect(self, value) -> None:
         self._rect = value
-        self.blit_data[1] = self._rect
+        self._rebuild_blit_data_()
+        self._dirty = True
 
     @property
     def blendmode(self) -> int:
@@ -344,7 +572,7 @@ class Widget(Place, Grid, Pack):
     @blendmode.setter
     def blendmode(self, value: int) -> None:
         self._blendmode = value
-        self.blit_data[3] = self._blendmode
+        self._dirty = True
 
     @property
     def theme(self) -> str | None:
@@ -365,8 +593,10 @@ class Widget(Place, Grid, Pack):
 
     # region Abstracts
 
-    @abstractmethod
-    def _perform_draw_(self, surface: Surface, *args, **kwargs) -> None:
+    # Plain methods rather than ``abc`` abstract methods: Widget is not an ABC, and
+    # undecorated hooks keep the per-frame call path free of abstract-method machinery.
+
+    def _perform_draw_(self, surface: Surface) -> None:
         """
         Draw the widget on the given surface.
 
@@ -375,8 +605,7 @@ class Widget(Place, Grid, Pack):
         """
         raise NotImplementedError("Subclasses should implement this method.")
 
-    @abstractmethod
-    def _handle_event_(self, event: Event, *args, **kwargs) -> None:
+    def _handle_event_(self, event: Event) -> None:
         """
         Handle an event for the widget.
 
@@ -385,8 +614,7 @@ class Widget(Place, Grid, Pack):
         """
         raise NotImplementedError("Subclasses should implement this method.")
 
-    @abstractmethod
-    def _perform_update_(self, delta: float, *args, **kwargs) -> None:
+    def _perform_update_(self, delta: float) -> None:
         """
         Update the widget's logic.
 
@@ -398,38 +626,69 @@ class Widget(Place, Grid, Pack):
     # endregion Abstracts
 
     @classmethod
-    def set_theme(cls, theme_dict):
-        """Set the widget's theme."""
-        cls._theme = theme_dict.get(cls.__name__, {})
+    def batch_draw(cls, surface: Surface, widgets: Iterable["Widget"], blend_flag: int = 0) -> None:
+        """
+        Blit the cached surfaces of the visible *widgets* onto *surface* in one call.
+
+        Widgets lying outside the surface's clip area are left out.
+
+        Meant for composited widgets, whose surface holds their whole appearance;
+        call their ``_recompose_`` first if they may be stale.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            widgets (Iterable[Widget]): Widgets to draw, bottom-most first.
+            blend_flag (int): Blend flag applied to every blit.
+        """
+        clip = surface.get_clip()
+        blit_batch(
+            surface,
+            [widget.blit_data for widget in widgets if widget._visible and clip.colliderect(widget._rect)],
+            blend_flag,
+        )
 
     # region Public
 
-    def draw(self, *args, surface: Surface = None, **kwargs) -> None:
+    def draw(self, surface: Surface = None) -> pygame.Rect | None:
         """
         Draw the widget on the given surface.
 
         Args:
             surface (pygame.Surface, optional): The surface to draw on.
+
+        Returns:
+            pygame.Rect | None: The screen area to pass to ``pygame.display.update``
+            when the widget changed since its last draw, otherwise None.
         """
         if self._visible:
-            if self.__class__.__name__ == "Widget":
+            if self._is_bare_widget:
                 if self._master is not None:
                     surface = self._master
+            elif self._master is not None:
+                surface = surface or self._master
+
+            # Nothing of a widget outside the clip area would reach the surface
+            if not self._show_tooltip and not surface.get_clip().colliderect(self._rect):
+                self._tooltip_rect = None
+                return self._take_dirty_rect_()
+
+            if self._is_bare_widget:
+                # Geometry managers move ``_rect`` in place, so refresh the inset in place too
+                inset = self._inset_rect
+                inset.update(self._rect)
+                inset.inflate_ip(-20, -20)
                 pygame.draw.rect(
                     surface,
                     self._theme["background"],
-                    self._rect.inflate(-20, -20),
+                    inset,
                     border_radius=1,
                 )
-                self._dirty = False
             else:
-                if self._master is not None:
-                    surface = surface or self._master
-                self._perform_draw_(surface, *args, **kwargs)
-            self._draw_tooltip_(surface)
-            self._dirty = False
+                self._perform_draw_(surface)
+            self._tooltip_rect = self._draw_tooltip_(surface)
+        return self._take_dirty_rect_()
 
-    def handle(self, event: Event, *args, **kwargs) -> bool:
+    def handle(self, event: Event) -> bool:
         """
         Handle an event for the widget.
 
@@ -447,41 +706,45 @@ class Widget(Place, Grid, Pack):
         Returns:
             bool: True if the event was consumed by the widget.
         """
-        if self._disabled:
+        if self._disabled or event.type in self._blocked_events:
             return False
 
         consumed = False
+        if self._focused:
+            focus_handler = _FOCUS_HANDLERS.get(event.type)
+            if focus_handler is not None:
+                getattr(self, focus_handler)(event)
+                consumed = True
 
-        if event.type == pygame.KEYDOWN and self._focused:
-            self.on_keydown(event)
-            consumed = True
-        elif event.type == pygame.KEYUP and self._focused:
-            self.on_keyup(event)
-            consumed = True
-
-        self._handle_event_(event, *args, **kwargs)
+        self._handle_event_(event)
 
-        if event.type in self._handler:
+        command = self._handler.get(event.type)
+        if command is not None:
             try:
-                self._handler[event.type]()
+                command()
                 consumed = True
             except Exception:
                 pass
 
+        if consumed:
+            self._dirty = True
         return consumed
 
-    def update(self, *args, delta: float = 0.0, **kwargs) -> None:
+    def update(self, delta: float = 0.0) -> None:
         """
         Update the widget's logic.
 
         Args:
             delta (float): Time since last update.
         """
-        mouse_pos = pygame.mouse.get_pos()
         if self._visible:
+            state, show_tooltip = self._state, self._show_tooltip
             self._process_after_queue()
-            self._perform_update_(delta, *args, **kwargs)
-            self._update_tooltip_(mouse_pos, delta)
+            self._perform_update_(delta)
+            if self._tooltip:
+                self._update_tooltip_(pygame.mouse.get_pos(), delta)
+            if state != self._state or show_tooltip != self._show_tooltip:
+                self._dirty = True
 
     def configure(self, config=None, **kwargs):
         """
@@ -538,6 +801,7 @@ class Widget(Place, Grid, Pack):
                 self._handler[event] = lambda: function(self)
             else:
                 raise ValueError("Command function signatures can have 0 or 1 parameter.")
+            self._reroute_events_()
         else:
             raise TypeError("Command function must be callable")
 
@@ -548,7 +812,9 @@ class Widget(Place, Grid, Pack):
         Args:
             event (int): Pygame event type.
         """
-        return self._handler.pop(event, None)
+        handler = self._handler.pop(event, None)
+        self._reroute_events_()
+        return handler
 
     def post(self, event: int, data: dict[str, Any] | None = None):
         """
@@ -584,14 +850,18 @@ class Widget(Place, Grid, Pack):
 
         else:
             raise TypeError("Function must be a callable or command name string.")
-        self._after_queue.append((run_at, callback))
+        self._after_queue = (*self._after_queue, (run_at, callback))
         return str(float(run_at))  # Return a handle (timestamp string)
 
     def _process_after_queue(self):
         """Check and run scheduled after callbacks."""
+        if not self._after_queue:
+            return
         now = time.time()
         to_run = [item for item in self._after_queue if item[0] <= now]
-        self._after_queue = [item for item in self._after_queue if item[0] > now]
+        if not to_run:
+            return
+        self._after_queue = tuple(item for item in self._after_queue if item[0] > now)
         for _, callback in to_run:
             try:
                 callback()
@@ -641,10 +911,12 @@ class Widget(Place, Grid, Pack):
     def focus(self):
         """Set focus to this widget."""
         self._focused = True
+        self._dirty = True
 
     def unfocus(self):
         """Remove focus from this widget."""
         self._focused = False
+        self._dirty = True
 
     def on_focus(self):
         """Override: Called when widget receives focus."""
@@ -671,14 +943,16 @@ class Widget(Place, Grid, Pack):
         """Enable the widget for interaction."""
         if self._disabled:
             self._disabled = False
-            self._state = "normal"
+            self._state = WidgetState.NORMAL
+            self._dirty = True
             self._enable_()
 
     def disable(self):
         """Disable the widget (no interaction)."""
         if not self._disabled:
             self._disabled = True
-            self._state = "disabled"
+            self._state = WidgetState.DISABLED
+            self._dirty = True
             self._disable_()
 
     def lift(self):
@@ -697,12 +971,13 @@ class Widget(Place, Grid, Pack):
         """Resize this widget"""
         self._width = width
         self._height = height
+        self._dirty = True
 
     def set_style(self, **style) -> None:
         """Update this widget's style dictionary at runtime."""
         if not style:
             return
-        self._theme.update(style)
+        self._update_theme_(style)
         self._dirty = True
 
     def reset_style(self) -> None:
@@ -733,23 +1008,27 @@ class Widget(Place, Grid, Pack):
         Args:
             **kwargs: Configuration options to set.
         """
+        # Pack/Grid/Place options are validated together before anything changes
+        layout = kwargs.keys() & LAYOUT_OPTIONS
+        if layout:
+            set_layout_options(self, {name: kwargs.pop(name) for name in layout})
 
         self._height = self._kwarg_get(kwargs, "height", self._height)
         self._width = self._kwarg_get(kwargs, "width", self._width)
         self._cursor = self._kwarg_get(kwargs, "cursor", self._cursor)
-        self._state = self._kwarg_get(kwargs, "state", self._state)
+        self._state = WidgetState(self._kwarg_get(kwargs, "state", self._state))
         self._disabled = self._kwarg_get(kwargs, "disabled", self._disabled)
         self._focused = self._kwarg_get(kwargs, "focused", self._focused)
         self._visible = self._kwarg_get(kwargs, "visible", self._visible)
-        self._dirty = self._kwarg_get(kwargs, "dirty", self._dirty)
+        self._dirty = self._kwarg_get(kwargs, "dirty", True)
 
         self._shadow = self._kwarg_get(kwargs, "shadow", self._shadow)
         self._shadow_width = self._kwarg_get(kwargs, "shadow_width", self._shadow_width)
         self._shadowoffset = self._kwarg_get(kwargs, "shadowoffset", self._shadowoffset)
-        self._shadowcolor = self._kwarg_get(kwargs, "shadowcolor", self._shadowcolor)
+        self._shadowcolor = self._normalize_color_(self._kwarg_get(kwargs, "shadowcolor", self._shadowcolor))
 
-        self._surface = self._kwarg_get(kwargs, "surface", self._surface)
-        self._rect = self._kwarg_get(kwargs, "rect", self._rect)
+        self.surface = self._kwarg_get(kwargs, "surface", self._surface)
+        self.rect = self._kwarg_get(kwargs, "rect", self._rect)
 
         self._angle = self._kwarg_get(kwargs, "angle", self._angle)
         self._flipx = self._kwarg_get(kwargs, "flipx", self._flipx)
@@ -770,7 +1049,7 @@ class Widget(Place, Grid, Pack):
 
         theme_update = self._kwarg_get(kwargs, "theme", None)
         if isinstance(theme_update, dict):
-            self._theme.update(theme_update)
+            self._update_theme_(theme_update)
 
         background = self._kwarg_get(kwargs, "background", None)
         if background is not None:
@@ -799,69 +1078,14 @@ class Widget(Place, Grid, Pack):
         Returns:
             Any: The value of the attribute.
         """
-        if attribute == "surface":
-            return self._surface
-        if attribute == "rect":
-            return self._rect
-        if attribute == "master":
-            return self._master
-        if attribute == "master_rect":
-            return self._master_rect
-        if attribute == "height":
-            return self._height
-        if attribute == "width":
-            return self._width
-        if attribute == "cursor":
-            return self._cursor
-        if attribute == "theme":
-            return self._theme
-        if attribute == "state":
-            return self._state
-        if attribute == "disabled":
-            return self._disabled
-        if attribute == "focused":
-            return self._focused
-        if attribute == "visible":
-            return self._visible
-        if attribute == "dirty":
-            return self._dirty
-        if attribute == "shadow":
-            return self._shadow
-        if attribute == "shadow_width":
-            return self._shadow_width
-        if attribute == "shadowoffset":
-            return self._shadowoffset
-        if attribute == "shadowcolor":
-            return self._shadowcolor
-        if attribute == "angle":
-            return self._angle
-        if attribute == "flipx":
-            return self._flipx
-        if attribute == "flipy":
-            return self._flipy
-        if attribute == "tooltip":
-            return self._tooltip
-        if attribute == "show_tooltip":
-            return self._show_tooltip
-        if attribute == "tooltip_delay":
-            return self._tooltip_delay
-        if attribute == "tooltip_timer":
-            return self._tooltip_timer
-        if attribute == "border_radius":
-            return self._border_radius
-        if attribute == "borderwidth":
-            return self._borderwidth
-        if attribute == "bordermode":
-            return self._bordermode
-        if attribute == "border_position":
-            return self._border_position
+        attr = self._config_attrs.get(attribute)
+        if attr is not None:
+            return getattr(self, attr)
 
         if attribute == "background":
             return self._theme.get("background")
         if attribute == "disable_color":
             return
-        if attribute == "shadowcolor":
-            return self._shadowcolor
         if attribute == "bordercolor":
             return self._theme.get("border_color")
         if attribute == "opacity":
@@ -871,12 +1095,10 @@ class Widget(Place, Grid, Pack):
 
     def _set_visible_(self, value) -> None:
         """Set the widget's visibility (True or False)."""
+        if value != self._visible:
+            self._dirty = True
         self._visible = value
 
-    def _get_visible_(self) -> bool:
-        """Return the widget's visibility."""
-        return self._visible
-
     def _update_tooltip_(self, mouse_pos, delta):
         """Update tooltip display logic. Call in update()."""
         if self._tooltip:
@@ -888,8 +1110,8 @@ class Widget(Place, Grid, Pack):
                 self._tooltip_timer = 0.0
                 self._show_tooltip = False
 
-    def _draw_tooltip_(self, surface):
-        """Draw the tooltip if needed. Call in draw()."""
+    def _draw_tooltip_(self, surface) -> pygame.Rect | None:
+        """Draw the tooltip if needed and return the area it covers. Call in draw()."""
         if self._show_tooltip:
             font = pygame.font.SysFont("Arial", 16)
             text_surf = font.render(self._tooltip, True, (255, 255, 255))
@@ -897,6 +1119,152 @@ class Widget(Place, Grid, Pack):
             bg_rect.topleft = (self._rect.right + 8, self._rect.top)
             pygame.draw.rect(surface, (0, 0, 0, 180), bg_rect.inflate(8, 8))
             surface.blit(text_surf, bg_rect)
+            return bg_rect.inflate(8, 8)
+        return None
+
+    def _paint_rect_(self) -> pygame.Rect:
+        """
+        Return the screen area the widget paints in its current state.
+
+        Widgets that draw outside their own rect (overlays, popups) should override this.
+        """
+        if self._show_tooltip and self._tooltip_rect is not None:
+            return self._rect.union(self._tooltip_rect)
+        return self._rect.copy()
+
+    def _take_dirty_rect_(self) -> pygame.Rect | None:
+        """
+        Clear the dirty flag and return the area that must be presented again.
+
+        The area covers both where the widget was last drawn and where it is
+        now, so moved or hidden widgets leave no stale pixels behind.
+        """
+        if not self._dirty:
+            return None
+        self._dirty = False
+        area = self._paint_rect_() if self._visible else None
+        previous, self._drawn_rect = self._drawn_rect, area
+        if previous is None:
+            return area
+        if area is None:
+            return previous
+        return previous.union(area)
+
+    def _recompose_(self) -> None:
+        """
+        Redraw the widget's appearance into its own ``_surface``.
+
+        Only called for composited widgets, which draw in local coordinates
+        and leave the final blit to ``draw()`` or a manager batch.
+        """
+
+    def _render_text_(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: pygame.Color | tuple,
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        """
+        Return ``font.render(text, antialias, color)``, cached on the widget.
+
+        Text only changes on user edits or state changes, so most frames reuse
+        a surface that is already converted to the display format.
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= _TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = convert_surface(font.render(text, antialias, color))
+            self._text_cache[key] = surface
+        return surface
+
+    def _invalidate_style_(self) -> None:
+        """
+        Rebuild the widget theme from the active theme and repaint on the next draw.
+
+        Entries that differ from the theme section the widget was built from
+        (``theme=`` overrides, colors passed to the constructor, ``set_style``)
+        are kept on top of the new section.
+        """
+        old = self._normalize_theme_(self._theme_source)
+        section = ThemeManager.lookup(type(self).__name__, default={})
+        new = self._normalize_theme_(section)
+
+        def overrides(theme: dict) -> dict:
+            return {key: value for key, value in theme.items() if key not in old or old[key] != value}
+
+        self._theme = {**new, **overrides(self._theme)}
+        self._base_theme = copy.deepcopy({**new, **overrides(self._base_theme)})
+        self._theme_source = section
+        self._text_cache.clear()
+        self._dirty = True
+
+    def _accepts_event_(self, event_type: int) -> bool:
+        """Return True if managers should route events of *event_type* to this widget."""
+        if event_type in self._blocked_events:
+            return False
+        handled = self._handled_events
+        return handled is None or event_type in handled or event_type in self._handler
+
+    def _adopt_(self, child: "Widget") -> None:
+        """Called when *child* is created with this widget as its master. Containers override this."""
+
+    def _needs_repaint_(self) -> bool:
+        """Return True if the widget changed since its last paint. Containers include their children."""
+        return self._dirty
+
+    def _rebuild_event_filter_(self) -> None:
+        """Recompute the event types dropped up front because their input device is disabled."""
+        self._blocked_events = frozenset().union(
+            *(types for flag, types in _DEVICE_EVENTS.items() if not getattr(self, flag))
+        )
+        self._reroute_events_()
+
+    def _reroute_events_(self) -> None:
+        """Tell the owning manager that the set of accepted event types changed."""
+        if self.parent is not None:
+            self.parent.invalidate_routes()
+
+    def _fit_surface_(self) -> None:
+        """
+        Recreate ``_surface`` at the size of ``_rect`` if a geometry manager resized the widget.
+
+        Composited widgets call this before painting, so a stretched widget is
+        painted over its whole area. Surface flags and alpha are kept.
+        """
+        old = self._surface
+        size = self._rect.size
+        if old.get_size() == size:
+            return
+        surface = pygame.Surface(size, old.get_flags() & pygame.SRCALPHA, 32)
+        surface.set_alpha(old.get_alpha())
+        self.surface = convert_surface(surface)
+        self._dirty = True
+
+    def _rebuild_blit_data_(self) -> None:
+        """Replace ``blit_data`` after ``_surface`` or ``_rect`` was swapped for another object."""
+        self.blit_data = (self._surface, self._rect)
+
+    def _convert_surfaces_(self) -> None:
+        """Convert the widget's surface to the display format once a display mode exists."""
+        if self._converted:
+            return
+        surface = convert_surface(self._surface)
+        if surface is not self._surface:
+            self.surface = surface
+            self._converted = True
+
+    def _animating_(self) -> bool:
+        """
+        Return True while the widget changes without any input (timers, carets, animations).
+
+        Managers use this to decide whether the main loop may block waiting for events.
+        """
+        if self._focused or self._after_queue:
+            return True
+        return bool(self._tooltip) and 0.0 < self._tooltip_timer < self._tooltip_delay
 
     def _enable_(self):
         """Run by subclass after enable()"""
@@ -992,17 +1360,34 @@ class Widget(Place, Grid, Pack):
         return value
 
     def _normalize_color_(self, value):
-        """Normalize string colors into pygame.Color while preserving tuples."""
-        if isinstance(value, str):
+        """Normalize color names, hex strings and RGB(A) sequences into pygame.Color.
+
+        Drawing calls accept a ``Color`` without re-parsing it, so colors are
+        converted once when set rather than on every draw. Other values pass through.
+        """
+        if isinstance(value, str) or (isinstance(value, (tuple, list)) and len(value) in (3, 4)):
             return pygame.Color(value)
         return value
 
+    def _normalize_theme_(self, values: dict) -> dict:
+        """Return a copy of *values* with the color entries normalized."""
+        return {
+            key: self._normalize_color_(value)
+            if key in ("background", "foreground") or key.endswith("color")
+            else value
+            for key, value in values.items()
+        }
+
+    def _update_theme_(self, values: dict) -> None:
+        """Merge *values* into the widget theme, normalizing the color entries."""
+        self._theme.update(self._normalize_theme_(values))
+
     def rotate(self, angle: int) -> "Widget":
         """Rotation Widget angle (degrees ``0-360``)"""
         assert isinstance(angle, int)
         if angle == self._angle:
             return self
-        self._surface = pygame.transform.rotate(self._surface, angle)
+        self.surface = pygame.transform.rotate(self._surface, angle)
         self._angle = angle % 360
         return self
 
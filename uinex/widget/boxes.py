@@ -116,7 +116,7 @@ class TextBox(Widget):
         text_rect.topleft = (self.padding, (self._rect.height - text_rect.height) // 2)
 
         # Draw selection highlight if any
-        if self.focused and self.selection and self.selection[0] != self.selection[1]:
+        if self._focused and self.selection and self.selection[0] != self.selection[1]:
             sel_start = min(self.selection)
             sel_end = max(self.selection)
             pre_text = self.text[:sel_start]
@@ -135,7 +135,7 @@ class TextBox(Widget):
         surface.blit(text_surf, text_rect)
 
         # Draw cursor if focused
-        if self.focused and self._cursor_visible:
+        if self._focused and self._cursor_visible:
             cursor_x = self.padding + self.font.size(self.text[: self.cursor_pos])[0]
             cursor_y = text_rect.top
             cursor_h = text_rect.height
@@ -151,16 +151,18 @@ class TextBox(Widget):
         """Handle keyboard and mouse events for text editing."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self._rect.collidepoint(event.pos):
-                self.focused = True
+                self._focused = True
                 # Set cursor position based on click
                 rel_x = event.pos[0] - self._rect.x - self.padding
                 self.cursor_pos = self._get_cursor_from_x(rel_x)
                 self.selection = None
-            else:
-                self.focused = False
+                self._dirty = True
+            elif self._focused:
+                self._focused = False
                 self.selection = None
+                self._dirty = True
 
-        if not self.focused:
+        if not self._focused:
             return
 
         if event.type == pygame.KEYDOWN:
@@ -213,7 +215,7 @@ class TextBox(Widget):
 
     def _perform_update_(self, delta, *args, **kwargs):
         """Update cursor blink."""
-        if self.focused:
+        if self._focused:
             self._cursor_timer += delta * 1000  # delta in seconds
             if self._cursor_timer >= self._blink_interval:
                 self._cursor_visible = not self._cursor_visible
@@ -629,9 +631,11 @@ class SpinBox(Widget):
                 # Set cursor position based on click
                 rel_x = rel_pos[0] - 8
                 self._cursor_pos = self._get_cursor_from_x(rel_x)
-            else:
+                self._dirty = True
+            elif self._focused:
                 self._focused = False
                 self._editing = False
+                self._dirty = True
 
         if not self._focused or not self.editable:
             return
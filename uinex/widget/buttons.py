@@ -33,6 +33,7 @@ from uinex.utils.mixins import ClickableMixin
 from uinex.utils.mixins import DoubleClickMixin
 from uinex.utils.mixins import HoverableMixin
 from uinex.widget.base import Widget
+from uinex.widget.base import WidgetState
 
 
 class Button(Widget, HoverableMixin, DoubleClickMixin, ClickableMixin):
@@ -61,13 +62,21 @@ class Button(Widget, HoverableMixin, DoubleClickMixin, ClickableMixin):
         _text (str): Button label text.
         _font (pygame.Font): Font for rendering text.
         _image (pygame.Surface): Optional image/icon.
-        _state (str): Current state ("normal", "hovered", "clicked", "disabled").
+        _state (WidgetState): Current state (normal, hovered, clicked, disabled).
         _disabled (bool): Whether the button is disabled.
         _handler (dict): Event handlers for custom events.
         _foreground, _background, _hovercolor, etc.: Colors for various states.
         _border_radius, _borderwidth, etc.: Border styling for various states.
     """
 
+    _config_attrs = {
+        **Widget._config_attrs,
+        "text": "_text",
+        "font": "_font",
+        "image": "_image",
+        "underline": "_underline",
+    }
+
     def __init__(
         self,
         master: Any | None = None,
@@ -97,7 +106,7 @@ class Button(Widget, HoverableMixin, DoubleClickMixin, ClickableMixin):
         if command is not None:
             self.bind(pygame.MOUSEBUTTONDOWN, command)
 
-        self._state: str = state
+        self._state: WidgetState = WidgetState(state)
         self._disabled: bool = disabled
 
         self._text: str = text
@@ -106,11 +115,10 @@ class Button(Widget, HoverableMixin, DoubleClickMixin, ClickableMixin):
         self._image: pygame.Surface = image
 
         # Font – prefer explicit argument, then fall back to theme, then system default
-        _font_cfg = ThemeManager.theme.get("font", ThemeManager.theme.get("Font", {}))
-        font_: pygame.Font = pygame.font.SysFont(
-            _font_cfg.get("family", "Arial"), _font_cfg.get("size", 14)
-        )
-        self._font: pygame.font.Font = font_ if font is None else font
+        if font is None:
+            _font_cfg = ThemeManager.theme.get("font", ThemeManager.theme.get("Font", {}))
+            font = pygame.font.SysFont(_font_cfg.get("family", "Arial"), _font_cfg.get("size", 14))
+        self._font: pygame.font.Font = font
 
         # Apply per-instance colour overrides (kwargs take precedence over theme)
         if background is not None:
@@ -143,6 +151,7 @@ class Button(Widget, HoverableMixin, DoubleClickMixin, ClickableMixin):
     @text.setter
     def text(self, _text):
         self._text = _text
+        self._dirty = True
 
     # endregion
 
@@ -152,7 +161,7 @@ class Button(Widget, HoverableMixin, DoubleClickMixin, ClickableMixin):
         """Disables the button so that it is no longer interactive."""
         if not self._disabled:
             self._disabled = True
-            self._set_state_("disabled")
+            self._set_state_(WidgetState.DISABLED)
             self._hover = False
             self._clicked = False
             self._double_clicked = False
@@ -161,50 +170,45 @@ class Button(Widget, HoverableMixin, DoubleClickMixin, ClickableMixin):
         """Re-enables the button, so it can once again be interacted with."""
         if self._disabled:
             self._disabled = False
-            self._set_state_("normal")
+            self._set_state_(WidgetState.NORMAL)
 
     # endregion
 
     # region Private
 
-    def _set_state_(self, state: str = None):
+    def _set_state_(self, state: WidgetState | str | None = None):
         """
         Set the state of the button.
 
         If state is None, it will determine the state based on the current conditions.
+        The button is only marked dirty when the state actually changes.
         """
         if state is None:
             if not self._disabled:
                 if self.hovered:
-                    self._state = "hovered"
+                    state = WidgetState.HOVERED
                 elif self.clicked:
-                    self._state = "clicked"
+                    state = WidgetState.CLICKED
                 else:
-                    self._state = "normal"
+                    state = WidgetState.NORMAL
             else:
-                self._state = "disabled"
+                state = WidgetState.DISABLED
         else:
+            state = WidgetState(state)
+        if state is not self._state:
             self._state = state
+            self._dirty = True
 
     def _get_state_foreground_(self) -> pygame.Color:
         """Get the foreground color based on the current state."""
-        if self._state == "hovered":
-            return self._theme["text_color"]
-        if self._state == "clicked":
-            return self._theme["text_color"]
-        if self._state == "disabled":
-            return self._theme["text_color"]
+        # Every state currently shares the text color
         return self._theme["text_color"]
 
     def _get_state_background_(self) -> pygame.Color:
         """Get the background color based on the current state."""
-        if self._state == "hovered":
-            return self._theme["hover_color"]
-        if self._state == "clicked":
-            return self._theme["hover_color"]
-        if self._state == "disabled":
-            return self._theme["hover_color"]
-        return self._theme["background"]
+        if self._state is WidgetState.NORMAL:
+            return self._theme["background"]
+        return self._theme["hover_color"]
 
     def _configure_set_(self, **kwargs) -> None:
         """
@@ -222,43 +226,6 @@ class Button(Widget, HoverableMixin, DoubleClickMixin, ClickableMixin):
         # hover_color, select_color
         # text_color, disable_text_color, select_text_color
 
-    def _configure_get_(self, attribute: str) -> Any:
-        """
-        Configure method to get the current value of an attribute.
-
-        Args:
-            attribute (str): The attribute name.
-
-        Returns:
-            Any: The value of the attribute.
-        """
-        if attribute == "text":
-            return self._text
-        if attribute == "font":
-            return self._font
-        if attribute == "image":
-            return self._image
-        # if attribute == "wraplength":
-        #     return self._wraplength
-        if attribute == "underline":
-            return self._underline
-
-        if attribute == "text_color":
-            return
-        if attribute == "disable_text_color":
-            return
-        if attribute == "select_text_color":
-            return
-        if attribute == "hover_text_color":
-            return
-
-        if attribute == "select_color":
-            return
-        if attribute == "hover_color":
-            return
-
-        return super()._configure_get_(attribute)
-
     def _perform_draw_(self, surface: pygame.Surface, *args, **kwargs) -> None:
         """
         Draw the button widget on the given surface with a modern look.
@@ -307,7 +274,7 @@ class Button(Widget, HoverableMixin, DoubleClickMixin, ClickableMixin):
             text_offset_x = img_rect.width + 16  # Space for image + padding
 
         # Render and draw text centered (with offset if image present)
-        btn_text = self._font.render(self._text, True, foreground)
+        btn_text = self._render_text_(self._font, self._text, foreground)
         btn_text_rect = btn_text.get_rect()
         btn_text_rect.centery = self._rect.centery
         if self._image:
@@ -343,10 +310,7 @@ class Button(Widget, HoverableMixin, DoubleClickMixin, ClickableMixin):
             delta (float): Time since last update.
         """
         self._set_state_()
-        if self._state == "hovered":
-            self._show_tooltip = True
-        else:
-            self._show_tooltip = False
+        self._show_tooltip = self._state is WidgetState.HOVERED
 
     # endregion
 
@@ -450,8 +414,10 @@ class CheckButton(Widget, HoverableMixin, ClickableMixin):
         self._text = text
 
         # Font and theme
-        font_ = pygame.font.SysFont(ThemeManager.theme["font"]["family"], ThemeManager.theme["font"]["size"])
-        self._font = kwargs.pop("font", font_)
+        if "font" in kwargs:
+            self._font = kwargs.pop("font")
+        else:
+            self._font = pygame.font.SysFont(ThemeManager.theme["font"]["family"], ThemeManager.theme["font"]["size"])
 
         # Sizing
         width = kwargs.pop("width", 28 + (self._font.size(self._text)[0] + 12 if self._text else 0))
@@ -464,13 +430,15 @@ class CheckButton(Widget, HoverableMixin, ClickableMixin):
         """Toggle the checked state and call the command callback if set."""
         if not self._disabled:
             self._checked = not self._checked
+            self._dirty = True
             # if self._command:
             #     self._command(self._checked)
 
     def set_checked(self, value: bool):
         """Set the checked state."""
-        if not self._disabled:
+        if not self._disabled and value != self._checked:
             self._checked = value
+            self._dirty = True
 
     def is_checked(self) -> bool:
         """Return True if checked, else False."""
@@ -490,17 +458,16 @@ class CheckButton(Widget, HoverableMixin, ClickableMixin):
             surface (pygame.Surface): The surface to draw on.
         """
         # Theme colors
-        theme = ThemeManager.theme.get("Checkbox", {})
         state = (
             "disabled" if self._disabled else ("hovered" if self.hovered else "selected" if self._checked else "normal")
         )
-        box_theme = theme.get(state, theme.get("normal", {}))
+        box_theme = ThemeManager.lookup("Checkbox", state) or ThemeManager.lookup("Checkbox", "normal", default={})
 
         box_rect = pygame.Rect(self._rect.left, self._rect.centery - 12, 24, 24)
         border_radius = box_theme.get("border_radius", 5)
         borderwidth = box_theme.get("borderwidth", 2)
-        bordercolor = pygame.Color(box_theme.get("bordercolor", "#339CFF"))
-        background = pygame.Color(box_theme.get("background", "#F7FAFC"))
+        bordercolor = ThemeManager.color(box_theme.get("bordercolor"), "#339CFF")
+        background = ThemeManager.color(box_theme.get("background"), "#F7FAFC")
 
         # Draw checkbox background
         pygame.draw.rect(surface, background, box_rect, border_radius=border_radius)
@@ -510,7 +477,7 @@ class CheckButton(Widget, HoverableMixin, ClickableMixin):
 
         # Draw checkmark if checked
         if self.clicked:
-            accent = pygame.Color(box_theme.get("foreground", "#339CFF"))
+            accent = ThemeManager.color(box_theme.get("foreground"), "#339CFF")
             # Draw a modern checkmark
             start = (box_rect.left + 6, box_rect.centery)
             mid = (box_rect.left + 11, box_rect.bottom - 6)
@@ -519,8 +486,8 @@ class CheckButton(Widget, HoverableMixin, ClickableMixin):
 
         # Draw label text
         if self._text:
-            text_color = pygame.Color(box_theme.get("foreground", "#1A2332"))
-            label = self._font.render(self._text, True, text_color)
+            text_color = ThemeManager.color(box_theme.get("foreground"), "#1A2332")
+            label = self._render_text_(self._font, self._text, text_color)
             label_rect = label.get_rect()
             label_rect.midleft = (box_rect.right + 8, box_rect.centery)
             surface.blit(label, label_rect)
@@ -816,7 +783,7 @@ class MenuButton(Widget):
         # Draw button border
         pygame.draw.rect(surface, (120, 120, 120), rect, 1)
         # Draw label
-        label_surf = self.font.render(self.text, True, self.foreground)
+        label_surf = self._render_text_(self.font, self.text, self.foreground)
         label_rect = label_surf.get_rect(center=rect.center)
         surface.blit(label_surf, label_rect)
         # Draw dropdown arrow
@@ -847,7 +814,7 @@ class MenuButton(Widget):
                 )
                 if i == self.selected_index:
                     pygame.draw.rect(surface, (200, 220, 255), item_rect)
-                item_surf = self.font.render(str(label), True, self.menu_foreground)
+                item_surf = self._render_text_(self.font, str(label), self.menu_foreground)
                 surface.blit(
                     item_surf,
                     (
@@ -40,6 +40,8 @@ from typing import Any
 import pygame
 
 from uinex.theme.manager import ThemeManager
+from uinex.utils.surface import acquire_surface
+from uinex.utils.surface import release_surface
 from uinex.widget.base import Widget
 
 __all__ = ["Dialog"]
@@ -120,6 +122,7 @@ class Dialog(Widget):
         self._body_font: pygame.font.Font = body_font or pygame.font.SysFont(_family, _size)
 
         self._button_rects: list[pygame.Rect] = []
+        self._overlay: pygame.Surface | None = None  # reused while the master size is unchanged
         self._hovered_btn: int | None = None
         self._pressed_btn: int | None = None
 
@@ -132,7 +135,7 @@ class Dialog(Widget):
 
     def show(self) -> None:
         """Show the dialog and centre it on the master surface."""
-        self._visible = True
+        self._set_visible_(True)
         if self._master is not None:
             mw = self._master.get_width()
             mh = self._master.get_height()
@@ -145,7 +148,7 @@ class Dialog(Widget):
         Args:
             result: The value to pass to the on_close callback.
         """
-        self._visible = False
+        self._set_visible_(False)
         if self._on_close is not None:
             self._on_close(result)
 
@@ -170,11 +173,21 @@ class Dialog(Widget):
             for i in range(n)
         ]
 
+    def _paint_rect_(self) -> pygame.Rect:
+        # The modal overlay covers the whole master surface
+        if self._master is not None:
+            return self._master.get_rect()
+        return super()._paint_rect_()
+
     def _perform_draw_(self, surface: pygame.Surface, *args, **kwargs) -> None:
         # Semi-transparent overlay over the whole surface
         if self._master is not None:
-            overlay = pygame.Surface(self._master.get_size(), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 140))
+            overlay = self._overlay
+            if overlay is None or overlay.get_size() != self._master.get_size():
+                if overlay is not None:
+                    release_surface(overlay)
+                overlay = self._overlay = acquire_surface(self._master.get_size())
+                overlay.fill((0, 0, 0, 140))
             surface.blit(overlay, (0, 0))
 
         bg = self._theme["background"]
@@ -214,19 +227,24 @@ class Dialog(Widget):
             btn_text_rect = btn_text.get_rect(center=btn_rect.center)
             surface.blit(btn_text, btn_text_rect)
 
+    def _button_at_(self, pos: tuple[int, int]) -> int | None:
+        """Return the index of the button under *pos*, or None."""
+        # A 1x1 rect at pos collides exactly with the rects containing pos
+        index = pygame.Rect(pos, (1, 1)).collidelist(self._button_rects)
+        return None if index < 0 else index
+
     def _handle_event_(self, event: pygame.event.Event, *args, **kwargs) -> None:
         if event.type == pygame.MOUSEMOTION:
-            self._hovered_btn = None
-            for i, btn_rect in enumerate(self._button_rects):
-                if btn_rect.collidepoint(event.pos):
-                    self._hovered_btn = i
-                    break
+            hovered = self._button_at_(event.pos)
+            if hovered != self._hovered_btn:
+                self._hovered_btn = hovered
+                self._dirty = True
 
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for i, btn_rect in enumerate(self._button_rects):
-                if btn_rect.collidepoint(event.pos):
-                    self._pressed_btn = i
-                    break
+            hit = self._button_at_(event.pos)
+            if hit is not None:
+                self._pressed_btn = hit
+                self._dirty = True
 
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             if self._pressed_btn is not None:
@@ -236,13 +254,14 @@ class Dialog(Widget):
                     self._pressed_btn = None
                     self.close(label)
                     return
-            self._pressed_btn = None
+                self._pressed_btn = None
+                self._dirty = True
 
-    def handle(self, event: pygame.event.Event, *args, **kwargs) -> bool:
+    def handle(self, event: pygame.event.Event) -> bool:
         """Handle events. While visible, the dialog consumes ALL events (modal)."""
         if not self._visible:
             return False
-        self._handle_event_(event, *args, **kwargs)
+        self._handle_event_(event)
         # Modal: consume every event while open
         return True
 
@@ -4,7 +4,7 @@ This module defines the Frame widget for Uinex, which acts as a container for gr
 other widgets. The Frame supports modern theming, rounded corners, borders, and background color.
 
 Features:
-    - Acts as a container for child widgets
+    - Acts as a container for child widgets, cached on a single backing surface
     - Modern theming via ThemeManager
     - Rounded corners and border styling
     - Optional background and border color
@@ -25,6 +25,7 @@ from typing import Any
 
 import pygame
 
+from uinex.utils.surface import blit_batch
 from uinex.widget.base import Widget
 
 
@@ -47,8 +48,15 @@ class Frame(Widget):
         _bordercolor (pygame.Color): Frame border color.
         _borderwidth (int): Frame border width.
         _border_radius (int): Frame border radius.
+        _children (list[Widget]): Widgets created with this frame as their master.
+
+    The frame surface doubles as the backing surface of its children: they are
+    painted onto it only when the frame or one of them changed, and the frame
+    is then blitted to its master in one call.
     """
 
+    _composited = True
+
     def __init__(
         self,
         master: Any | None = None,
@@ -60,6 +68,8 @@ class Frame(Widget):
         border_radius: int | None = None,
         **kwargs,
     ):
+        self._children: list[Widget] = []
+        self._child_blit_seq: list[tuple[pygame.Surface, pygame.Rect]] = []  # Reused across repaints
         Widget.__init__(self, master, width, height, **kwargs)
 
         custom_theme = {
@@ -77,8 +87,52 @@ class Frame(Widget):
         Args:
             surface (pygame.Surface): The surface to draw on.
         """
-        self._surface.fill(self._theme["background"])
-        surface.blit(self._surface, self._rect)
+        self._recompose_()
+        surface.blit(self._surface, self._rect, special_flags=self._blendmode)
+
+    def _recompose_(self) -> None:
+        """Repaint the background and children, unless nothing changed since the last repaint."""
+        self._fit_surface_()
+        children = self._children
+        if not self._needs_repaint_():
+            return
+        target = self._surface
+        target.fill(self._theme["background"])
+
+        # Runs of composited children are blitted together, as in WidgetManager.draw_all
+        batch = self._child_blit_seq
+        flags = 0  # blend mode shared by the pending batch
+        clip = target.get_clip()
+        for child in children:
+            if not child._visible or (not child._show_tooltip and not clip.colliderect(child._rect)):
+                child._tooltip_rect = None
+                child._take_dirty_rect_()
+            elif child._composited and not child._show_tooltip:
+                child._recompose_()
+                if batch and child._blendmode != flags:
+                    blit_batch(target, batch, flags)
+                    batch.clear()
+                flags = child._blendmode
+                batch.append(child.blit_data)
+                child._take_dirty_rect_()
+            else:
+                if batch:
+                    blit_batch(target, batch, flags)
+                    batch.clear()
+                child.draw(surface=target)
+        if batch:
+            blit_batch(target, batch, flags)
+            batch.clear()
+        self._dirty = True
+
+    def _needs_repaint_(self) -> bool:
+        """Return True if the frame or any widget nested in it changed since the last repaint."""
+        return self._dirty or any(child._needs_repaint_() for child in self._children)
+
+    def _adopt_(self, child: Widget) -> None:
+        """Paint *child* onto the frame surface from now on."""
+        self._children.append(child)
+        self._dirty = True
 
     def _handle_event_(self, event: pygame.event.Event, *args, **kwargs) -> None:
         """Frame does not handle events by default."""
@@ -84,9 +84,10 @@ class Entry(Widget, HoverableMixin, ClickableMixin):
         self._blink = True
         self._blink_timer = 0
 
-        _font_cfg = ThemeManager.theme.get("font", ThemeManager.theme.get("Font", {}))
-        font_ = pygame.font.SysFont(_font_cfg.get("family", "Arial"), _font_cfg.get("size", 14))
-        self._font = font or font_
+        if font is None:
+            _font_cfg = ThemeManager.theme.get("font", ThemeManager.theme.get("Font", {}))
+            font = pygame.font.SysFont(_font_cfg.get("family", "Arial"), _font_cfg.get("size", 14))
+        self._font = font
 
         Widget.__init__(self, master, width, height, **kwargs)
         HoverableMixin.__init__(self)
@@ -100,17 +101,21 @@ class Entry(Widget, HoverableMixin, ClickableMixin):
         """Set the text value."""
         self._text = value
         self._cursor_pos = len(value)
+        self._dirty = True
         if self._on_change:
             self._on_change(self._text)
 
     def focus(self):
         """Set focus to this entry."""
-        if not self._disabled:
+        if not self._disabled and not self._focused:
             self._focused = True
+            self._dirty = True
 
     def blur(self):
         """Remove focus from this entry."""
-        self._focused = False
+        if self._focused:
+            self._focused = False
+            self._dirty = True
 
     def is_focused(self) -> bool:
         """Return True if entry is focused."""
@@ -136,19 +141,18 @@ class Entry(Widget, HoverableMixin, ClickableMixin):
         Args:
             surface (pygame.Surface): The surface to draw on.
         """
-        theme = ThemeManager.theme.get("Entry", {})
         state = (
             "disabled" if self._disabled else "focused" if self._focused else "hovered" if self.hovered else "normal"
         )
-        entry_theme = theme.get(state, theme.get("normal", {}))
+        entry_theme = ThemeManager.lookup("Entry", state) or ThemeManager.lookup("Entry", "normal", default={})
 
         rect = self._rect
         border_radius = entry_theme.get("border_radius", 8)
         borderwidth = entry_theme.get("borderwidth", 2)
-        bordercolor = pygame.Color(entry_theme.get("bordercolor", "#339CFF"))
-        background = pygame.Color(entry_theme.get("background", "#F7FAFC"))
-        text_color = pygame.Color(entry_theme.get("foreground", "#1A2332"))
-        placeholder_color = pygame.Color(entry_theme.get("placeholder", "#A0AEC0"))
+        bordercolor = ThemeManager.color(entry_theme.get("bordercolor"), "#339CFF")
+        background = ThemeManager.color(entry_theme.get("background"), "#F7FAFC")
+        text_color = ThemeManager.color(entry_theme.get("foreground"), "#1A2332")
+        placeholder_color = ThemeManager.color(entry_theme.get("placeholder"), "#A0AEC0")
 
         # Draw background
         pygame.draw.rect(surface, background, rect, border_radius=border_radius)
@@ -157,9 +161,9 @@ class Entry(Widget, HoverableMixin, ClickableMixin):
 
         # Render text or placeholder
         if self._text or self._focused:
-            txt = self._font.render(self._text, True, text_color)
+            txt = self._render_text_(self._font, self._text, text_color)
         else:
-            txt = self._font.render(self._placeholder, True, placeholder_color)
+            txt = self._render_text_(self._font, self._placeholder, placeholder_color)
         txt_rect = txt.get_rect()
         txt_rect.midleft = (rect.left + 12, rect.centery)
         surface.blit(txt, txt_rect)
@@ -211,6 +215,7 @@ class Entry(Widget, HoverableMixin, ClickableMixin):
             elif event.unicode and event.key != pygame.K_RETURN:
                 self._text = self._text[: self._cursor_pos] + event.unicode + self._text[self._cursor_pos :]
                 self._cursor_pos += 1
+            self._dirty = True
             if self._on_change:
                 self._on_change(self._text)
 
@@ -226,6 +231,7 @@ class Entry(Widget, HoverableMixin, ClickableMixin):
             if self._blink_timer > 0.5:
                 self._blink = not self._blink
                 self._blink_timer = 0
+                self._dirty = True
         else:
             self._blink = False
             self._blink_timer = 0
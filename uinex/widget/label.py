@@ -17,13 +17,12 @@ Author: Sackey Ezekiel Etrue (https://github.com/djoezeke) & Uinex Contributors
 License: MIT
 """
 
-from typing import Any
-
 import pygame
 
 from uinex.theme.manager import ThemeManager
 from uinex.utils.mixins import HoverableMixin
 from uinex.widget.base import Widget
+from uinex.widget.base import WidgetState
 
 __all__ = ["Label"]
 
@@ -64,9 +63,23 @@ class Label(Widget, HoverableMixin):
         _hovercolor (pygame.Color): Foreground color on hover.
         _hoverbackground (pygame.Color): Background color on hover.
         _bordercolor (pygame.Color): Border color.
-        _state (str): Current state ("normal", "hovered", etc.).
+        _state (WidgetState): Current state (normal, hovered, etc.).
+
+    The label is painted into its own surface only when it changes; clean
+    frames just blit that cached surface.
     """
 
+    _composited = True
+
+    _config_attrs = {
+        **Widget._config_attrs,
+        "text": "_text",
+        "font": "_font",
+        "image": "_image",
+        "wraplength": "_wraplength",
+        "underline": "_underline",
+    }
+
     def __init__(
         self,
         master: Widget | pygame.Surface | None = None,
@@ -89,9 +102,9 @@ class Label(Widget, HoverableMixin):
 
         # Apply per-instance colour overrides
         if background is not None:
-            self._theme["background"] = background
+            self._theme["background"] = self._normalize_color_(background)
         if foreground is not None:
-            self._theme["text_color"] = foreground
+            self._theme["text_color"] = self._normalize_color_(foreground)
 
         # Ensure mandatory keys exist
         self._theme.setdefault("background", (30, 30, 46))
@@ -106,12 +119,11 @@ class Label(Widget, HoverableMixin):
         self._wraplength: bool = True
         self._underline: bool = False
 
-        # Font
-        _font_cfg = ThemeManager.theme.get("font", ThemeManager.theme.get("Font", {}))
-        font_: pygame.Font = pygame.font.SysFont(
-            _font_cfg.get("family", "Arial"), _font_cfg.get("size", 14)
-        )
-        self._font: pygame.Font = font_ if font is None else font
+        # Font – the theme font is only looked up when none is given
+        if font is None:
+            _font_cfg = ThemeManager.theme.get("font", ThemeManager.theme.get("Font", {}))
+            font = pygame.font.SysFont(_font_cfg.get("family", "Arial"), _font_cfg.get("size", 14))
+        self._font: pygame.Font = font
 
         # Image/Icon
         self._image: pygame.Surface = image
@@ -128,6 +140,7 @@ class Label(Widget, HoverableMixin):
     @text.setter
     def text(self, value: str) -> None:
         self._text = value
+        self._dirty = True
 
     def get_text(self) -> str:
         """Get the current label text.
@@ -144,20 +157,25 @@ class Label(Widget, HoverableMixin):
             new_text (str): The new text to display.
         """
         self._text = new_text
+        self._dirty = True
 
     # endregion
 
     # region Private
 
-    def _set_state_(self, state: str = None) -> None:
+    def _set_state_(self, state: WidgetState | str | None = None) -> None:
         """Set the state of the label.
 
         If state is None, it will determine the state based on the current conditions.
+        The painted surface is only invalidated when the state actually changes.
         """
         if state is None:
-            self._state = "hovered" if self.hovered else "normal"
+            state = WidgetState.HOVERED if self.hovered else WidgetState.NORMAL
         else:
+            state = WidgetState(state)
+        if state is not self._state:
             self._state = state
+            self._dirty = True
 
     def _get_state_foreground_(self) -> pygame.Color:
         """Get the foreground color based on the current state.
@@ -165,7 +183,7 @@ class Label(Widget, HoverableMixin):
         Returns:
             pygame.Color: The foreground color.
         """
-        return self._theme["text_color"] if self._state == "hovered" else self._theme["text_color"]
+        return self._theme["text_color"]
 
     def _get_state_background_(self) -> pygame.Color:
         """Get the background color based on the current state.
@@ -173,7 +191,7 @@ class Label(Widget, HoverableMixin):
         Returns:
             pygame.Color: The background color.
         """
-        return self._theme["hover_color"] if self._state == "hovered" else self._theme["background"]
+        return self._theme["hover_color"] if self._state is WidgetState.HOVERED else self._theme["background"]
 
     def _configure_set_(self, **kwargs) -> None:
         """Configure method to set custom attributes.
@@ -192,62 +210,44 @@ class Label(Widget, HoverableMixin):
 
         super()._configure_set_(**kwargs)
 
-    def _configure_get_(self, attribute: str) -> Any:
-        """Configure method to get the current value of an attribute.
-
-        Args:
-            attribute (str): The attribute name.
-
-        Returns:
-            Any: The value of the attribute.
-        """
-
-        if attribute == "text":
-            return self._text
-        if attribute == "font":
-            return self._font
-        if attribute == "image":
-            return self._image
-        if attribute == "wraplength":
-            return self._wraplength
-        if attribute == "underline":
-            return self._underline
-
-        if attribute == "text_color":
-            return
-        if attribute == "hover_text_color":
-            return
-        if attribute == "disable_text_color":
-            return
-
-        if attribute == "hover_color":
-            return
-
-        return super()._configure_get_(attribute)
-
     def _perform_draw_(self, surface: pygame.Surface, *args, **kwargs) -> None:
         """Draw the widget on the given surface.
 
         Args:
             surface (pygame.Surface): The surface to draw on.
         """
+        self._recompose_()
+        surface.blit(self._surface, self._rect, special_flags=self._blendmode)
+
+    def _recompose_(self) -> None:
+        """Paint the label into its own surface, if it changed since the last paint."""
+        self._fit_surface_()
+        if not self._dirty:
+            return
+
         foreground = self._get_state_foreground_()
         background = self._get_state_background_()
+        target = self._surface
+        rect = target.get_rect()
 
-        # Draw Label Background
-        pygame.draw.rect(
-            surface,
-            background,
-            self._rect,
-            border_radius=self._border_radius,
-        )
+        # Draw Label Background; square corners cover the whole surface, so one fill does
+        if self._border_radius:
+            target.fill((0, 0, 0, 0))
+            pygame.draw.rect(
+                target,
+                background,
+                rect,
+                border_radius=self._border_radius,
+            )
+        else:
+            target.fill(background)
 
         # Draw Label Border
         if self._borderwidth > 0:
             pygame.draw.rect(
-                surface,
+                target,
                 self._theme.get("border_color", (100, 100, 120)),
-                self._rect,
+                rect,
                 self._borderwidth,
                 self._border_radius,
             )
@@ -256,20 +256,23 @@ class Label(Widget, HoverableMixin):
         text_offset_x = 0
         if self._image:
             img_rect = self._image.get_rect()
-            img_rect.centery = self._rect.centery
-            img_rect.left = self._rect.left + 8
-            surface.blit(self._image, img_rect)
+            img_rect.centery = rect.centery
+            img_rect.left = rect.left + 8
+            target.blit(self._image, img_rect)
             text_offset_x = img_rect.width + 8
 
-        # Draw Label Text
-        btn_text = self._font.render(self._text, True, foreground)
+        # Draw Label Text, unless the label is too small to show even part of a glyph
+        half_glyph = self._font.get_height() // 2
+        if rect.width < half_glyph or rect.height < half_glyph:
+            return
+        btn_text = self._render_text_(self._font, self._text, foreground)
         if self._image:
             btn_text_rect = btn_text.get_rect()
-            btn_text_rect.centery = self._rect.centery
-            btn_text_rect.left = self._rect.left + text_offset_x
+            btn_text_rect.centery = rect.centery
+            btn_text_rect.left = rect.left + text_offset_x
         else:
-            btn_text_rect = btn_text.get_rect(center=self._rect.center)
-        surface.blit(btn_text, btn_text_rect)
+            btn_text_rect = btn_text.get_rect(center=rect.center)
+        target.blit(btn_text, btn_text_rect)
 
     def _handle_event_(self, event: pygame.event.Event, *args, **kwargs) -> None:
         """Handle an event for the widget.
@@ -41,11 +41,14 @@ License: MIT
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Callable
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 import pygame
 
+from uinex.utils.surface import blit_batch
+
 if TYPE_CHECKING:
     from pygame import Surface
 
@@ -53,6 +56,9 @@ if TYPE_CHECKING:
 
 __all__ = ["WidgetManager"]
 
+# Past this many rects ``display.update`` is slower than presenting their union.
+MAX_DIRTY_RECTS = 50
+
 
 class BaseManager:
     """Internal base class for layered widget management."""
@@ -65,6 +71,11 @@ class BaseManager:
     def __init__(self):
         self._surfaces: dict[int, Surface] = {}
         self.children: dict[int, list[Widget]] = defaultdict(list)
+        self._blit_seq: list[tuple[Surface, pygame.Rect]] = []  # reused across frames
+        self._routes: dict[int, list[Widget]] = {}  # event type -> widgets in dispatch order
+        # Frame plan specialised to the registered widgets, rebuilt after (un)registration
+        self._updaters: tuple[Callable[..., None], ...] | None = None
+        self._draw_order: tuple[Widget, ...] | None = None
 
     # ─────────────────────────────────────────────────
     # Registration
@@ -83,7 +94,10 @@ class BaseManager:
         """
         if not self.is_registered(widget):
             widget.parent = self
+            # Widgets built before ``display.set_mode`` still hold unconverted surfaces
+            widget._convert_surfaces_()
             self.children[layer].append(widget)
+            self._invalidate_plan_()
 
     def unregister(self, widget: Widget) -> None:
         """Unregister a widget from the manager.
@@ -95,6 +109,7 @@ class BaseManager:
             if widget in layer_widgets:
                 layer_widgets.remove(widget)
                 widget.parent = None
+                self._invalidate_plan_()
                 return
 
     def is_registered(self, widget: Widget) -> bool:
@@ -125,6 +140,58 @@ class BaseManager:
                 yield from self.walk_widgets(root=child)
                 yield child
 
+    def subscribed_events(self) -> set[int] | None:
+        """Return the event types any registered widget handles.
+
+        ``None`` means some widget (e.g. a modal dialog) handles every type.
+        Pass the result to ``pygame.event.set_allowed`` to keep other events
+        out of the queue entirely.
+        """
+        types: set[int] = set()
+        for layer_widgets in self.children.values():
+            for widget in layer_widgets:
+                if widget._handled_events is None:
+                    return None
+                types.update(widget._handled_events, widget._handler)
+        return types
+
+    def invalidate_routes(self) -> None:
+        """Forget cached event routes; called when a widget binds or unbinds an event type."""
+        self._routes.clear()
+
+    def _invalidate_plan_(self) -> None:
+        """Drop every cached per-frame plan after the widget set changed."""
+        self._routes.clear()
+        self._updaters = None
+        self._draw_order = None
+
+    def _update_plan_(self) -> tuple[Callable[..., None], ...]:
+        """Return bound ``update`` methods of all widgets, highest layer first (cached)."""
+        if self._updaters is None:
+            self._updaters = tuple(
+                widget.update for lyr in sorted(self.children.keys(), reverse=True) for widget in self.children[lyr]
+            )
+        return self._updaters
+
+    def _draw_plan_(self) -> tuple[Widget, ...]:
+        """Return all widgets in draw order, lowest layer first (cached)."""
+        if self._draw_order is None:
+            self._draw_order = tuple(widget for lyr in sorted(self.children.keys()) for widget in self.children[lyr])
+        return self._draw_order
+
+    def _route_(self, event_type: int) -> list[Widget]:
+        """Return the widgets accepting *event_type*, in dispatch order (cached)."""
+        route = self._routes.get(event_type)
+        if route is None:
+            route = [
+                widget
+                for lyr in sorted(self.children.keys(), reverse=True)
+                for widget in reversed(self.children[lyr])
+                if widget._accepts_event_(event_type)
+            ]
+            self._routes[event_type] = route
+        return route
+
     def clear(self) -> None:
         """Remove all registered widgets."""
         for layer_widgets in self.children.values():
@@ -145,10 +212,11 @@ class BaseManager:
 
         Events are dispatched to widgets from the highest layer downward.
         Within a layer, widgets are visited in reverse registration order
-        (last-registered = on top).  A widget that returns a truthy value
-        from :meth:`~uinex.widget.base.Widget.handle` is considered to have
-        consumed the event; the event is then **excluded** from the returned
-        list.
+        (last-registered = on top).  Only widgets that accept the event's
+        type are visited; the routes are cached per type.  A widget that
+        returns a truthy value from :meth:`~uinex.widget.base.Widget.handle`
+        is considered to have consumed the event; the event is then
+        **excluded** from the returned list.
 
         After processing events, ``update()`` is called on every widget.
 
@@ -161,25 +229,16 @@ class BaseManager:
         """
         unconsumed: list[pygame.event.Event] = []
 
-        # Sorted layers: highest first so overlay widgets receive events first
-        sorted_layers = sorted(self.children.keys(), reverse=True)
-
         for event in events:
-            consumed = False
-            for lyr in sorted_layers:
-                for widget in reversed(self.children[lyr]):
-                    if widget.handle(event):
-                        consumed = True
-                        break
-                if consumed:
+            for widget in self._route_(event.type):
+                if widget.handle(event):
                     break
-            if not consumed:
+            else:
                 unconsumed.append(event)
 
-        # Update all widgets
-        for lyr in sorted_layers:
-            for widget in self.children[lyr]:
-                widget.update(delta=dt)
+        # Update all widgets, highest layer first
+        for update in self._update_plan_():
+            update(delta=dt)
 
         return unconsumed
 
@@ -187,17 +246,73 @@ class BaseManager:
     # Drawing / updating helpers
     # ─────────────────────────────────────────────────
 
-    def draw_all(self, surface: Surface) -> None:
+    def draw_all(self, surface: Surface) -> list[pygame.Rect]:
         """Draw all registered widgets onto *surface*.
 
         Widgets on lower layers are drawn first (underneath higher layers).
+        Runs of consecutive composited widgets sharing a blend mode are
+        blitted in a single batched call instead of one ``blit`` per widget;
+        a change of blend mode starts a new run so stacking order is kept.
+        Widgets of one opaque color are filled directly instead of blitted.
+        Widgets lying entirely outside the surface's clip area are skipped.
 
         Args:
             surface: The ``pygame.Surface`` to draw on.
+
+        Returns:
+            The areas changed since the previous call, ready for
+            ``pygame.display.update``.  Empty when nothing changed.
         """
-        for lyr in sorted(self.children.keys()):
-            for widget in self.children[lyr]:
-                widget.draw(surface=surface)
+        batch = self._blit_seq
+        flags = 0  # blend mode shared by the pending batch
+        clip = surface.get_clip()
+        dirty_rects: list[pygame.Rect] = []
+        for widget in self._draw_plan_():
+            if not widget._visible:
+                rect = widget._take_dirty_rect_()
+            elif not widget._show_tooltip and not clip.colliderect(widget._rect):
+                # Entirely outside the drawable area: nothing to blit
+                widget._tooltip_rect = None
+                rect = widget._take_dirty_rect_()
+            elif widget._solid_color is not None and not widget._blendmode and not widget._show_tooltip:
+                if batch:
+                    blit_batch(surface, batch, flags)
+                    batch.clear()
+                surface.fill(widget._solid_color, widget._rect)
+                rect = widget._take_dirty_rect_()
+            elif widget._composited and not widget._show_tooltip:
+                widget._recompose_()
+                if batch and widget._blendmode != flags:
+                    blit_batch(surface, batch, flags)
+                    batch.clear()
+                flags = widget._blendmode
+                batch.append(widget.blit_data)
+                rect = widget._take_dirty_rect_()
+            else:
+                if batch:
+                    blit_batch(surface, batch, flags)
+                    batch.clear()
+                rect = widget.draw(surface=surface)
+            if rect is not None:
+                dirty_rects.append(rect)
+        if batch:
+            blit_batch(surface, batch, flags)
+            batch.clear()
+        if len(dirty_rects) > MAX_DIRTY_RECTS:
+            return [dirty_rects[0].unionall(dirty_rects[1:])]
+        return dirty_rects
+
+    def has_animations(self) -> bool:
+        """Return ``True`` if any visible widget changes without user input.
+
+        While this is ``False`` the host loop may block on ``pygame.event.wait``
+        instead of polling, since nothing on screen changes until an event arrives.
+        """
+        return any(
+            widget._visible and widget._animating_()
+            for layer_widgets in self.children.values()
+            for widget in layer_widgets
+        )
 
     def update_all(self, dt: float = 0.0) -> None:
         """Call ``update()`` on every registered widget.
@@ -205,9 +320,8 @@ class BaseManager:
         Args:
             dt: Elapsed time since the last frame (seconds).
         """
-        for layer_widgets in self.children.values():
-            for widget in layer_widgets:
-                widget.update(delta=dt)
+        for update in self._update_plan_():
+            update(delta=dt)
 
     # ─────────────────────────────────────────────────
     # Dunder helpers
@@ -30,10 +30,17 @@ from typing import Literal
 
 import pygame
 
+from uinex.utils.surface import convert_surface
 from uinex.widget.base import Widget
 
 __all__ = ["Progressbar"]
 
+# Unit-circle (cos, sin) pairs every 2 degrees clockwise from the top, shared by all meters
+_ARC_STEP = 2
+_ARC_UNIT: tuple[tuple[float, float], ...] = tuple(
+    (math.cos(math.radians(angle)), math.sin(math.radians(angle))) for angle in range(-90, 271, _ARC_STEP)
+)
+
 
 class Progressbar(Widget):
     """A modern, customizable progress bar widget for Uinex.
@@ -88,6 +95,14 @@ class Progressbar(Widget):
 
     """
 
+    _config_attrs = {
+        **Widget._config_attrs,
+        "value": "_value",
+        "minimum": "_minimum",
+        "maximum": "_maximum",
+        "orientation": "orientation",
+    }
+
     def __init__(
         self,
         master: Any | None = None,
@@ -167,6 +182,10 @@ class Progressbar(Widget):
         self._last_update = time.time()
 
         self._font = font or pygame.font.SysFont(None, 18)
+        self._text_blit: tuple[pygame.Surface, pygame.Rect] | None = None  # Last centered (text, rect) pair
+        self._chrome: pygame.Surface | None = None  # Background and border, see _chrome_surface_
+        self._chrome_key: tuple | None = None
+        self._fill_rect = pygame.Rect(0, 0, 0, 0)  # Filled part of the bar, updated in place each draw
 
         custom_theme = {
             "background": (0, 120, 215),
@@ -275,72 +294,77 @@ class Progressbar(Widget):
         """
 
         foreground = self._theme["bar_color"]
-        background = self._theme["background"]
-        bordercolor = self._theme["border_color"]
-
+        orientation = self.orientation
+        bw = self._borderwidth
         rect = self._rect
-
-        # Draw filled rounded rectangle for button background
-        pygame.draw.rect(surface, background, self._rect, border_radius=self._border_radius)
-
-        # Draw border (rounded)
-        if self._borderwidth > 0:
-            pygame.draw.rect(surface, bordercolor, self._rect, self._borderwidth, self._border_radius)
+        left, top, width, height = rect
+        fill_rect = self._fill_rect
+        draw_rect = pygame.draw.rect
+
+        # Rounded background and border only change with size or theme; a plain
+        # square bar is a single fill
+        if self._border_radius or bw:
+            surface.blit(self._chrome_surface_(), rect)
+        else:
+            surface.fill(self._theme["background"], rect)
 
         percent = (self._value - self._minimum) / (self._maximum - self._minimum)
         percent = max(0.0, min(1.0, percent))
 
         if self._mode == "indeterminate" and self._indeterminate:
             # Draw moving bar for indeterminate mode
-            bar_length = rect.width if self.orientation == "horizontal" else rect.height
-            indet_width = int(bar_length * 0.3)
             pos = int(self._indet_pos)
-            if self.orientation == "horizontal":
-                fill_rect = pygame.Rect(
-                    rect.left + pos,
-                    rect.top + self._borderwidth,
-                    indet_width,
-                    rect.height - 2 * self._borderwidth,
-                )
+            if orientation == "horizontal":
+                fill_rect.update(left + pos, top + bw, int(width * 0.3), height - 2 * bw)
             else:
-                fill_rect = pygame.Rect(
-                    rect.left + self._borderwidth,
-                    rect.top + pos,
-                    rect.width - 2 * self._borderwidth,
-                    indet_width,
-                )
-            pygame.draw.rect(surface, foreground, fill_rect)
-        else:
-            # ...existing determinate drawing code...
-            if self.orientation == "horizontal":
-                fill_width = int((rect.width - 2 * self._borderwidth) * percent)
-                fill_rect = pygame.Rect(
-                    rect.left + self._borderwidth,
-                    rect.top + self._borderwidth,
-                    fill_width,
-                    rect.height - 2 * self._borderwidth,
-                )
-                pygame.draw.rect(surface, foreground, fill_rect)
-            elif self.orientation == "vertical":
-                fill_height = int((rect.height - 2 * self._borderwidth) * percent)
-                fill_rect = pygame.Rect(
-                    rect.left + self._borderwidth,
-                    rect.bottom - self._borderwidth - fill_height,
-                    rect.width - 2 * self._borderwidth,
-                    fill_height,
-                )
-                pygame.draw.rect(surface, foreground, fill_rect)
-
-        # Draw text (percentage) if enabled
-        if self._text and self._mode == "determinate":
+                fill_rect.update(left + bw, top + pos, width - 2 * bw, int(height * 0.3))
+            draw_rect(surface, foreground, fill_rect)
+        elif orientation == "horizontal":
+            fill_rect.update(left + bw, top + bw, int((width - 2 * bw) * percent), height - 2 * bw)
+            draw_rect(surface, foreground, fill_rect)
+        elif orientation == "vertical":
+            fill_height = int((height - 2 * bw) * percent)
+            fill_rect.update(left + bw, top + height - bw - fill_height, width - 2 * bw, fill_height)
+            draw_rect(surface, foreground, fill_rect)
+
+        # Draw text (percentage) if enabled and the bar can show at least half a glyph
+        half_glyph = self._font.get_height() // 2
+        if self._text and self._mode == "determinate" and width >= half_glyph and height >= half_glyph:
             percent_val = int(percent * 100)
             if self._mask:
                 text = self._mask.format(percent_val)
             else:
                 text = f"{percent_val}%"
-            txt_surf = self._font.render(text, True, self._theme["text_color"])
-            txt_rect = txt_surf.get_rect(center=rect.center)
-            surface.blit(txt_surf, txt_rect)
+            txt_surf = self._render_text_(self._font, text, self._theme["text_color"])
+            surface.blit(*self._center_text_(txt_surf))
+
+    def _chrome_surface_(self) -> pygame.Surface:
+        """Return the background and border of the bar, painted at (0, 0).
+
+        The surface is repainted only when the size, colors or border style change.
+        """
+        theme = self._theme
+        key = (self._rect.size, theme["background"], theme["border_color"], self._border_radius, self._borderwidth)
+        if key != self._chrome_key:
+            chrome = convert_surface(pygame.Surface(self._rect.size, pygame.SRCALPHA))
+            area = chrome.get_rect()
+            pygame.draw.rect(chrome, theme["background"], area, border_radius=self._border_radius)
+            if self._borderwidth > 0:
+                pygame.draw.rect(chrome, theme["border_color"], area, self._borderwidth, self._border_radius)
+            self._chrome = chrome
+            self._chrome_key = key
+        return self._chrome
+
+    def _center_text_(self, txt_surf: pygame.Surface) -> tuple[pygame.Surface, pygame.Rect]:
+        """Return *txt_surf* with its rect centered on the widget.
+
+        The rect is reused while the rendered text and the widget center stay the same.
+        """
+        blit = self._text_blit
+        center = self._rect.center
+        if blit is None or blit[0] is not txt_surf or blit[1].center != center:
+            blit = self._text_blit = (txt_surf, txt_surf.get_rect(center=center))
+        return blit
 
     def _handle_event_(self, event, *args, **kwargs):
         """Handle mouse events for interactive value setting (optional).
@@ -359,6 +383,10 @@ class Progressbar(Widget):
             value = self._minimum + percent * (self._maximum - self._minimum)
             self.set(value)
 
+    def _animating_(self) -> bool:
+        """Return True while the indeterminate animation is running."""
+        return (self._mode == "indeterminate" and self._indeterminate) or super()._animating_()
+
     def _perform_update_(self, delta, *args, **kwargs):
         """Update logic for Progressbar (handles indeterminate animation).
 
@@ -375,26 +403,6 @@ class Progressbar(Widget):
                 self._indet_pos = 0.0
             self._dirty = True
 
-    def _configure_get_(self, attribute: str) -> Any:
-        """Get configuration attribute value.
-
-        Args:
-            attribute (str): Attribute name.
-
-        Returns:
-            Any: Attribute value.
-        """
-        if attribute is not None:
-            if attribute == "value":
-                return self._value
-            if attribute == "minimum":
-                return self._minimum
-            if attribute == "maximum":
-                return self._maximum
-            if attribute == "orientation":
-                return self.orientation
-            return super()._configure_get_(attribute)
-
     def _configure_set_(self, **kwargs) -> None:
         """Set configuration attributes.
 
@@ -553,6 +561,10 @@ class Meter(Progressbar):
             **kwargs,
         )
 
+        # Pie polygon of the last draw, keyed by (center, radius, steps)
+        self._arc_key: tuple | None = None
+        self._arc_points: list[tuple[int, int]] = []
+
     # region Private
 
     def _perform_draw_(self, surface, *args, **kwargs):
@@ -583,15 +595,18 @@ class Meter(Progressbar):
             pygame.draw.circle(surface, background, center, radius)
 
             if percent > 0:
-                # Draw arc as filled pie
-                points = [center]
-                for angle in range(start_angle, end_angle + 1, 2):
-                    rad = angle * 3.14159 / 180
-                    x = center[0] + int(radius * math.cos(rad))
-                    y = center[1] + int(radius * math.sin(rad))
-                    points.append((x, y))
-                if len(points) > 2:
-                    pygame.draw.polygon(surface, foreground, points)
+                # Draw arc as filled pie, rebuilt only when value or geometry changes
+                steps = (end_angle - start_angle) // _ARC_STEP + 1
+                key = (center, radius, steps)
+                if key != self._arc_key:
+                    cx, cy = center
+                    self._arc_points = [center]
+                    self._arc_points.extend(
+                        (cx + int(radius * cos), cy + int(radius * sin)) for cos, sin in _ARC_UNIT[:steps]
+                    )
+                    self._arc_key = key
+                if len(self._arc_points) > 2:
+                    pygame.draw.polygon(surface, foreground, self._arc_points)
 
             pygame.draw.circle(surface, foreground, center, radius, self._borderwidth)
 
@@ -601,9 +616,8 @@ class Meter(Progressbar):
                     text = self._mask.format(percent_val)
                 else:
                     text = f"{percent_val}%"
-                txt_surf = self._font.render(text, True, self._theme["text_color"])
-                txt_rect = txt_surf.get_rect(center=rect.center)
-                surface.blit(txt_surf, txt_rect)
+                txt_surf = self._render_text_(self._font, text, self._theme["text_color"])
+                surface.blit(*self._center_text_(txt_surf))
         else:
             super()._perform_draw_(surface, *args, **kwargs)
 
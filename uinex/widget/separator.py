@@ -46,6 +46,8 @@ class Separator(Widget):
         length (int): Length of the separator.
     """
 
+    _composited = True
+
     def __init__(
         self,
         master: Any | None = None,
@@ -67,7 +69,8 @@ class Separator(Widget):
         self._orientation = orientation
         self._thickness = thickness
         self._length = length
-        self._color = color
+        self._color = pygame.Color(color)
+        self._update_solid_color_()
 
     # region Property
 
@@ -75,15 +78,34 @@ class Separator(Widget):
 
     # region Public
 
+    def set_opacity(self, alpha: int) -> None:
+        """Set surface alpha/opacity between 0 and 255."""
+        super().set_opacity(alpha)
+        self._update_solid_color_()
+
     # endregion
 
     # region Private
 
     def _perform_draw_(self, surface, *args, **kwargs):
         """Draw the separator line."""
-
-        self._surface.fill(self._color)
-        surface.blit(self._surface, self._rect)
+        if self._solid_color is not None and not self._blendmode:
+            surface.fill(self._solid_color, self._rect)
+            return
+        self._recompose_()
+        surface.blit(self._surface, self._rect, special_flags=self._blendmode)
+
+    def _update_solid_color_(self) -> None:
+        """Fill the separator directly only while both its color and its surface are opaque."""
+        alpha = self._surface.get_alpha()
+        opaque = self._color.a == 255 and (alpha is None or alpha == 255)
+        self._solid_color = self._color if opaque else None
+
+    def _recompose_(self):
+        """Fill the separator surface with the line color, if it changed since the last fill."""
+        self._fit_surface_()
+        if self._dirty:
+            self._surface.fill(self._color)
 
     def _handle_event_(self, event, *args, **kwargs):
         """Separator does not handle events."""
@@ -19,6 +19,7 @@ License: MIT
 
 import pygame
 
+from uinex.utils.surface import convert_surface
 from uinex.widget.base import Widget
 
 __all__ = ["SizeGrip"]
@@ -95,7 +96,7 @@ class SizeGrip(Widget):
                     self._master.height = new_height
                     # Optionally, update surface/rect if needed
                     if hasattr(self._master, "surface"):
-                        self._master.surface = pygame.Surface((new_width, new_height), pygame.SRCALPHA)
+                        self._master.surface = convert_surface(pygame.Surface((new_width, new_height), pygame.SRCALPHA))
                         self._master.rect.size = (new_width, new_height)
                 self._dirty = True
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -25,6 +25,8 @@ from typing import Any
 import pygame
 
 from uinex.theme.manager import ThemeManager
+from uinex.utils.surface import acquire_surface
+from uinex.utils.surface import release_surface
 from uinex.widget.base import Widget
 
 __all__ = ["Tooltip"]
@@ -113,8 +115,10 @@ class Tooltip(Widget):
         text_surface = self._font.render(text or " ", True, (255, 255, 255))
         self._width = text_surface.get_width() + self._padding * 2
         self._height = text_surface.get_height() + self._padding * 2
-        self._surface = pygame.Surface((self._width, self._height), pygame.SRCALPHA, 32)
-        self._rect = self._surface.get_rect(topleft=self._rect.topleft)
+        if self._surface.get_size() != (self._width, self._height):
+            release_surface(self._surface)
+            self.surface = acquire_surface((self._width, self._height))
+        self.rect = self._surface.get_rect(topleft=self._rect.topleft)
 
     def attach(self, target: Widget) -> None:
         """Attach the tooltip to a new target widget.
@@ -124,7 +128,7 @@ class Tooltip(Widget):
         """
         self._target = target
         self._hover_timer = 0.0
-        self._visible = False
+        self._set_visible_(False)
 
     # ─────────────────────────────────────────────────
     # Widget internals
@@ -156,7 +160,8 @@ class Tooltip(Widget):
         if self._target._rect.collidepoint(mouse_pos):
             self._hover_timer += delta
             if self._hover_timer >= self._delay:
-                self._visible = True
+                self._set_visible_(True)
+                topleft = self._rect.topleft
                 # Position tooltip near cursor, clamped within master surface
                 mx, my = mouse_pos
                 self._rect.topleft = (mx + 14, my + 10)
@@ -167,6 +172,8 @@ class Tooltip(Widget):
                         self._rect.right = mw - 2
                     if self._rect.bottom > mh:
                         self._rect.bottom = my - 2
+                if self._rect.topleft != topleft:
+                    self._dirty = True
         else:
             self._hover_timer = 0.0
-            self._visible = False
+            self._set_visible_(False)